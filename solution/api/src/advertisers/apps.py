@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AdvertisersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "advertisers"
+
+    def ready(self):
+        from advertisers import signals
@@ -1,30 +1,147 @@
+import functools
+import hashlib
 import json
+import re
+import threading
 
-from conf.settings import GIGACHAT_MODEL
+from advertisers.models import LLMCache
+from conf import settings
+from core.metrics import timed
 
 
+class GigaChatProvider:
+    def __init__(self):
+        self.client = None
+        self.lock = threading.Lock()
+
+    def get_client(self):
+        if self.client is None:
+            with self.lock:
+                if self.client is None:
+                    from gigachat import GigaChat
+
+                    self.client = GigaChat(
+                        credentials=settings.GIGACHAT_TOKEN,
+                        scope=settings.GIGACHAT_SCOPE,
+                        model=settings.GIGACHAT_MODEL,
+                        ca_bundle_file=settings.GIGACHAT_CA_BUNDLE_FILE,
+                    )
+        return self.client
+
+    def chat(self, prompt):
+        with timed("llm"):
+            return self.get_client().chat(prompt).choices[0].message.content
+
+
+llm_provider = GigaChatProvider()
+
+OBSCENE_DETAIL = "Presence of obscene language in the ad_text"
+DRUGS_DETAIL = "Drugs and prohibited substances in the ad_text"
+UNREADABLE_DETAIL = "Absolutely unreadable ad_text"
+UNINTERPRETABLE_DETAIL = "LLM could not interpret your ad_text, it is incorrect"
+
+OBSCENE_PATTERN = re.compile(
+    r"\b(?:"
+    r"(?:на|по|о|от|за|в|вы|до|ра[сз])?ху[йеёяю]"
+    r"|\w*пизд"
+    r"|(?:за|вы|у|на|по|до|от|про|раз|съ)?[её]б(?:а[лнтш]|ут|уч|[её]т|ну|л[оая]|ись)"
+    r"|бля[дт]"
+    r"|муд(?:ак|ил)"
+    r"|залуп"
+    r"|пид[оа]р"
+    r"|шлюх"
+    r"|(?:mother)?fuck"
+    r"|cunt"
+    r")",
+    re.IGNORECASE,
+)
+DRUGS_PATTERN = re.compile(
+    r"\b(?:"
+    r"героин(?:а|ом|у)?"
+    r"|кокаин(?:а|ом|у)?"
+    r"|(?:мет)?амфетамин(?:а|ом|у)?"
+    r"|мефедрон(?:а|ом|у)?"
+    r"|марихуан(?:а|ы|ой|у)"
+    r"|гашиш(?:а|ем|у)?"
+    r"|экстази"
+    r"|лсд"
+    r"|cocaine"
+    r"|heroin"
+    r"|(?:meth)?amphetamines?"
+    r"|marijuana"
+    r"|mdma"
+    r"|lsd"
+    r")\b",
+    re.IGNORECASE,
+)
+DRUGS_PREVENTION_PATTERN = re.compile(
+    r"\b(?:профилакти|зависим|лечени|реабилит|анонимн|addiction|rehab|treatment)",
+    re.IGNORECASE,
+)
+HOMOGLYPHS = str.maketrans("aceopxykmtbh", "асеорхукмтвн")
+WORD_PATTERN = re.compile(r"\w+")
+LATIN_PATTERN = re.compile(r"[a-z]", re.IGNORECASE)
+CYRILLIC_PATTERN = re.compile(r"[а-яё]", re.IGNORECASE)
+
+
+def replace_homoglyphs(match):
+    word = match.group()
+    if LATIN_PATTERN.search(word) and CYRILLIC_PATTERN.search(word):
+        return word.translate(HOMOGLYPHS)
+    return word
+
+
+def prefilter_moderation(text):
+    text = WORD_PATTERN.sub(replace_homoglyphs, text.lower())
+    if OBSCENE_PATTERN.search(text):
+        return {"passed": False, "detail": OBSCENE_DETAIL}
+    if DRUGS_PATTERN.search(text) and not DRUGS_PREVENTION_PATTERN.search(text):
+        return {"passed": False, "detail": DRUGS_DETAIL}
+    if not any(char.isalnum() for char in text):
+        return {"passed": False, "detail": UNREADABLE_DETAIL}
+
+    return None
+
+
+def cache_llm_response(function):
+    @functools.wraps(function)
+    def wrapper(*args):
+        if not settings.LLM_CACHE_MAX_SIZE:
+            return function(*args)
+
+        key = hashlib.sha256(
+            json.dumps([function.__name__, *args], ensure_ascii=False).encode()
+        ).hexdigest()
+        response = LLMCache.get_response(key)
+        if response is None:
+            response = function(*args)
+            if response is not None:
+                LLMCache.set_response(key, response)
+        return response
+
+    return wrapper
+
+
+@cache_llm_response
 def generate_ad_text(description, title, company_name):
-    response = (
-        GIGACHAT_MODEL.chat(
-            "Сгенерируй рекламное объявление по описанию названию рекламы и компании,"
-            " максимальная длина 400 символов, минимальная 120, ни в коем случае"
-            " не пиши ничего кроме объявления это очень важно, НЕ ИСПОЛЬЗУЙ"
-            " двойные кавычки, только одинарные, это тоже важно"
-            " если описание абсолютно некорректное, например просто"
-            " набор безсвязных символов или что то вообще не похожее на описание рекламы"
-            " то в ответе напиши только слово 'Некорректно'\n"
-            f"название компании: {company_name}\n"
-            f"название рекламы: {title}\n"
-            f"описание: {description}"
-        )
-        .choices[0]
-        .message.content
+    response = llm_provider.chat(
+        "Сгенерируй рекламное объявление по описанию названию рекламы и компании,"
+        " максимальная длина 400 символов, минимальная 120, ни в коем случае"
+        " не пиши ничего кроме объявления это очень важно, НЕ ИСПОЛЬЗУЙ"
+        " двойные кавычки, только одинарные, это тоже важно"
+        " если описание абсолютно некорректное, например просто"
+        " набор безсвязных символов или что то вообще не похожее на описание рекламы"
+        " то в ответе напиши только слово 'Некорректно'\n"
+        f"название компании: {company_name}\n"
+        f"название рекламы: {title}\n"
+        f"описание: {description}"
     )
 
     return str(response).replace('"', ""), "некорректно" != response.lower()
 
 
-def moderate(text):
+@cache_llm_response
+def moderate_with_llm(text):
     moderation_prompt = (
         "Тебе нужно модерировать текст рекламы. Ответ должен быть строго "
         'в формате: {"passed": true, "detail": "детально об ошибке"}. '
@@ -47,14 +164,17 @@ def moderate(text):
         f"пунктов, выбирай любой. Вот текст: {text}"
     )
 
-    response = GIGACHAT_MODEL.chat(moderation_prompt).choices[0].message.content
+    response = llm_provider.chat(moderation_prompt)
 
     try:
-        response = json.loads(response)
+        return json.loads(response)
     except json.decoder.JSONDecodeError:
-        response = {
-            "passed": False,
-            "detail": "LLM could not interpret your ad_text, it is incorrect",
-        }
+        return None
+
 
-    return response
+def moderate(text):
+    return (
+        prefilter_moderation(text)
+        or moderate_with_llm(text)
+        or {"passed": False, "detail": UNINTERPRETABLE_DETAIL}
+    )
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from advertisers.moderation import ModerationWorker
+from conf import settings
+
+
+class Command(BaseCommand):
+    help = "Process the campaign moderation queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency", type=int, default=settings.MODERATION_WORKER_CONCURRENCY
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when the queue is empty instead of polling for new tasks",
+        )
+
+    def handle(self, *args, **options):
+        worker = ModerationWorker(
+            options["concurrency"], settings.MODERATION_POLL_INTERVAL_MS
+        )
+        try:
+            worker.run(wait=not options["once"])
+        except KeyboardInterrupt:
+            worker.stop()
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:39
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0008_remove_campaign_images_campaignimage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                verbose_name="Время создания",
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0009_campaign_created_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(
+                fields=["start_date", "end_date"], name="campaign_active_dates_idx"
+            ),
+        ),
+    ]
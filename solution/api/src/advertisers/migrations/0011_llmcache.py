@@ -0,0 +1,46 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:50
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0010_campaign_campaign_active_dates_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LLMCache",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="Хеш запроса"
+                    ),
+                ),
+                ("response", models.JSONField(verbose_name="Ответ LLM")),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Время создания"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["created_at"], name="llm_cache_created_at_idx")
+                ],
+            },
+        ),
+    ]
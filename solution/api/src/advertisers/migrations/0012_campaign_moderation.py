@@ -0,0 +1,75 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:51
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0011_llmcache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="moderation_detail",
+            field=models.TextField(
+                blank=True, null=True, verbose_name="Причина отклонения модерацией"
+            ),
+        ),
+        migrations.AddField(
+            model_name="campaign",
+            name="moderation_status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("APPROVED", "Approved"),
+                    ("REJECTED", "Rejected"),
+                ],
+                default="APPROVED",
+                max_length=350,
+                verbose_name="Статус модерации",
+            ),
+        ),
+        migrations.CreateModel(
+            name="ModerationTask",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("ad_text", models.TextField(verbose_name="Текст объявления")),
+                (
+                    "claimed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Время взятия в работу"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Время создания"
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="moderation_task",
+                        to="advertisers.campaign",
+                        verbose_name="Реклама",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0012_campaign_moderation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(
+                fields=["advertiser", "created_at", "id"],
+                name="campaign_advertiser_list_idx",
+            ),
+        ),
+    ]
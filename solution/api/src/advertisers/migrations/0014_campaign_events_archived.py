@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0013_campaign_advertiser_list_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="events_archived",
+            field=models.BooleanField(
+                default=False, verbose_name="Просмотры и клики перенесены в архив"
+            ),
+        ),
+    ]
@@ -1,5 +1,9 @@
+from datetime import timedelta
+
 from django.db import models
+from django.utils import timezone
 
+from conf import settings
 from core.models import UUIDModel
 
 
@@ -58,6 +62,53 @@ class Campaign(UUIDModel):
         verbose_name="Рекламодатель",
         on_delete=models.CASCADE,
     )
+    created_at = models.DateTimeField("Время создания", auto_now_add=True)
+    moderation_status = models.CharField(
+        "Статус модерации",
+        max_length=350,
+        choices=(
+            ("PENDING", "Pending"),
+            ("APPROVED", "Approved"),
+            ("REJECTED", "Rejected"),
+        ),
+        default="APPROVED",
+    )
+    moderation_detail = models.TextField(
+        "Причина отклонения модерацией", null=True, blank=True
+    )
+    events_archived = models.BooleanField(
+        "Просмотры и клики перенесены в архив", default=False
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["start_date", "end_date"], name="campaign_active_dates_idx"
+            ),
+            models.Index(
+                fields=["advertiser", "created_at", "id"],
+                name="campaign_advertiser_list_idx",
+            ),
+        ]
+
+
+class ModerationTask(UUIDModel):
+    campaign = models.OneToOneField(
+        Campaign,
+        related_name="moderation_task",
+        on_delete=models.CASCADE,
+        verbose_name="Реклама",
+    )
+    ad_text = models.TextField("Текст объявления")
+    claimed_at = models.DateTimeField("Время взятия в работу", null=True, blank=True)
+    created_at = models.DateTimeField("Время создания", auto_now_add=True)
+
+    @classmethod
+    def enqueue(cls, campaign):
+        cls.objects.update_or_create(
+            campaign=campaign,
+            defaults={"ad_text": campaign.ad_text, "claimed_at": None},
+        )
 
 
 class CampaignImage(UUIDModel):
@@ -71,3 +122,37 @@ class CampaignImage(UUIDModel):
         on_delete=models.CASCADE,
         verbose_name="Объявление",
     )
+
+
+class LLMCache(UUIDModel):
+    key = models.CharField("Хеш запроса", max_length=64, unique=True)
+    response = models.JSONField("Ответ LLM")
+    created_at = models.DateTimeField("Время создания", auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["created_at"], name="llm_cache_created_at_idx")]
+
+    @classmethod
+    def get_response(cls, key):
+        expires_at = timezone.now() - timedelta(seconds=settings.LLM_CACHE_TTL_SECONDS)
+        return (
+            cls.objects.filter(key=key, created_at__gte=expires_at)
+            .values_list("response", flat=True)
+            .first()
+        )
+
+    @classmethod
+    def set_response(cls, key, response):
+        cls.objects.bulk_create(
+            [cls(key=key, response=response)],
+            update_conflicts=True,
+            unique_fields=["key"],
+            update_fields=["response", "created_at"],
+        )
+
+        expires_at = timezone.now() - timedelta(seconds=settings.LLM_CACHE_TTL_SECONDS)
+        cls.objects.filter(created_at__lt=expires_at).delete()
+        evicted_ids = cls.objects.order_by("-created_at").values_list("pk", flat=True)[
+            settings.LLM_CACHE_MAX_SIZE :
+        ]
+        cls.objects.filter(pk__in=list(evicted_ids)).delete()
@@ -0,0 +1,89 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from advertisers.llm_integration import moderate
+from advertisers.models import Campaign, ModerationTask
+from advertisers.targeting import targeting_index
+from conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def claim_task():
+    claim_expired_at = timezone.now() - timedelta(
+        seconds=settings.MODERATION_TASK_TIMEOUT_SECONDS
+    )
+    with transaction.atomic():
+        task = (
+            ModerationTask.objects.select_for_update(skip_locked=True)
+            .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=claim_expired_at))
+            .order_by("created_at")
+            .first()
+        )
+        if task is not None:
+            task.claimed_at = timezone.now()
+            task.save(update_fields=["claimed_at"])
+    return task
+
+
+def process_task(task):
+    moderation = moderate(task.ad_text)
+    with transaction.atomic():
+        updated = Campaign.objects.filter(
+            pk=task.campaign_id, ad_text=task.ad_text, moderation_status="PENDING"
+        ).update(
+            moderation_status="APPROVED" if moderation["passed"] else "REJECTED",
+            moderation_detail=None if moderation["passed"] else moderation["detail"],
+        )
+        ModerationTask.objects.filter(
+            pk=task.pk, ad_text=task.ad_text, claimed_at=task.claimed_at
+        ).delete()
+
+    if updated:
+        targeting_index.invalidate()
+
+
+def process_next_task():
+    task = claim_task()
+    if task is None:
+        return False
+
+    try:
+        process_task(task)
+    except Exception:
+        logger.exception("Moderation of campaign %s failed", task.campaign_id)
+    return True
+
+
+class ModerationWorker:
+    def __init__(self, concurrency, poll_interval_ms):
+        self.concurrency = concurrency
+        self.poll_interval_ms = poll_interval_ms
+        self.stop_event = threading.Event()
+
+    def run_thread(self, wait):
+        try:
+            while not self.stop_event.is_set():
+                if not process_next_task():
+                    if not wait:
+                        return
+                    self.stop_event.wait(self.poll_interval_ms / 1000)
+        finally:
+            connection.close()
+
+    def run(self, wait=True):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self.run_thread, wait) for _ in range(self.concurrency)
+            ]
+        for future in futures:
+            future.result()
+
+    def stop(self):
+        self.stop_event.set()
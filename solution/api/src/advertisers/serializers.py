@@ -2,7 +2,13 @@ from django.core.validators import MinValueValidator
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
-from advertisers.models import Advertiser, Campaign, Target, CampaignImage
+from advertisers.models import (
+    Advertiser,
+    Campaign,
+    Target,
+    CampaignImage,
+    ModerationTask,
+)
 from conf.settings import MULTI_PART_DATA_FOR_CAMPAIGN
 from core.models import CurrentDate
 from core.serializers import NotNullModelSerializerMixin
@@ -74,6 +80,8 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
             "targeting",
             "description_prompt",
             "moderate_ad_text",
+            "moderation_status",
+            "moderation_detail",
         ]
 
         if MULTI_PART_DATA_FOR_CAMPAIGN:
@@ -85,6 +93,8 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
             "end_date": {"required": False},
             "impressions_limit": {"required": False},
             "clicks_limit": {"required": False},
+            "moderation_status": {"read_only": True},
+            "moderation_detail": {"read_only": True},
         }
 
     def __init__(self, *args, **kwargs):
@@ -94,6 +104,13 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
             if isinstance(field, (serializers.IntegerField, serializers.FloatField)):
                 field.validators.append(MinValueValidator(0))
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if not settings.ASYNC_MODERATION:
+            fields.pop("moderation_status")
+            fields.pop("moderation_detail")
+        return fields
+
     def to_representation(self, instance):
         repr = super().to_representation(instance)
         if MULTI_PART_DATA_FOR_CAMPAIGN:
@@ -148,8 +165,16 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
                 "with description_prompt or"
                 " you did not specify any of these"
             )
+        if not self.context.get("defer_llm_checks"):
+            self.run_llm_checks(validated_data)
+
+        return validated_data
+
+    def run_llm_checks(self, validated_data):
         if "description_prompt" in validated_data:
-            company = get_object_or_404(Advertiser, id=self.context["advertiser_id"])
+            company = self.context.get("advertiser") or get_object_or_404(
+                Advertiser, id=self.context["advertiser_id"]
+            )
             text, correct = generate_ad_text(
                 validated_data["description_prompt"],
                 validated_data["ad_title"],
@@ -163,12 +188,17 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
 
         optional_moderation = validated_data.pop("moderate_ad_text", False)
 
-        if "ad_text" in validated_data and (
-            settings.MODERATE_AD_TEXT or optional_moderation
-        ):
-            moderation = moderate(validated_data["ad_text"])
-            if not moderation["passed"]:
-                raise serializers.ValidationError(moderation["detail"])
+        if "ad_text" in validated_data:
+            validated_data["moderation_status"] = "APPROVED"
+            validated_data["moderation_detail"] = None
+
+            if settings.MODERATE_AD_TEXT or optional_moderation:
+                if settings.ASYNC_MODERATION:
+                    validated_data["moderation_status"] = "PENDING"
+                else:
+                    moderation = moderate(validated_data["ad_text"])
+                    if not moderation["passed"]:
+                        raise serializers.ValidationError(moderation["detail"])
 
         return validated_data
 
@@ -191,6 +221,8 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
             images = validated_data.pop("uploaded_images", None)
 
         campaign = Campaign.objects.create(advertiser=advertiser, **validated_data)
+        if campaign.moderation_status == "PENDING":
+            ModerationTask.enqueue(campaign)
         if images is not None:
             for image in images:
                 CampaignImage.objects.create(campaign=campaign, image=image)
@@ -218,6 +250,10 @@ class CampaignSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
             instance.targeting = targeting
 
         instance = super().update(instance, validated_data)
+        if instance.moderation_status == "PENDING":
+            ModerationTask.enqueue(instance)
+        elif "ad_text" in validated_data:
+            ModerationTask.objects.filter(campaign=instance).delete()
         instance.images.all().delete()
 
         for image_data in images_data:
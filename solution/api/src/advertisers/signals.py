@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from advertisers.models import Campaign, Target
+from advertisers.targeting import targeting_index
+
+COUNTER_FIELDS = {"impressions_count", "clicks_count"}
+
+
+@receiver([post_save, post_delete], sender=Campaign)
+@receiver([post_save, post_delete], sender=Target)
+def invalidate_targeting_index(sender, update_fields=None, created=False, **kwargs):
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
+        return
+    if created and sender is Target:
+        return
+    targeting_index.invalidate()
@@ -0,0 +1,100 @@
+from advertisers.models import Campaign
+from core.models import CacheVersion, CurrentDate
+
+AGE_BUCKET_SIZE = 10
+MAX_AGE_BUCKET = 15
+
+
+def get_age_bucket(age):
+    return min(max(age // AGE_BUCKET_SIZE, 0), MAX_AGE_BUCKET)
+
+
+class TargetingIndex:
+    version_name = "campaigns"
+
+    def __init__(self):
+        self.key = None
+        self.targets = {}
+        self.by_gender = {}
+        self.by_location = {}
+        self.by_age_bucket = {}
+
+    def invalidate(self):
+        CacheVersion.bump(self.version_name)
+
+    def build(self, today):
+        targets = {}
+        by_gender = {}
+        by_location = {}
+        by_age_bucket = {}
+
+        campaigns = Campaign.objects.filter(
+            start_date__lte=today,
+            end_date__gte=today,
+            moderation_status="APPROVED",
+            events_archived=False,
+        ).values_list(
+            "id",
+            "targeting__gender",
+            "targeting__location",
+            "targeting__age_from",
+            "targeting__age_to",
+        )
+
+        for campaign_id, gender, location, age_from, age_to in campaigns:
+            targets[campaign_id] = (age_from, age_to)
+            by_gender.setdefault(None if gender == "ALL" else gender, set()).add(
+                campaign_id
+            )
+            by_location.setdefault(location, set()).add(campaign_id)
+
+            if age_from is None and age_to is None:
+                by_age_bucket.setdefault(None, set()).add(campaign_id)
+                continue
+
+            first_bucket = 0 if age_from is None else get_age_bucket(age_from)
+            last_bucket = MAX_AGE_BUCKET if age_to is None else get_age_bucket(age_to)
+            for bucket in range(first_bucket, last_bucket + 1):
+                by_age_bucket.setdefault(bucket, set()).add(campaign_id)
+
+        self.targets = targets
+        self.by_gender = by_gender
+        self.by_location = by_location
+        self.by_age_bucket = by_age_bucket
+
+    def refresh(self):
+        key = (CacheVersion.get_version(self.version_name), CurrentDate.get_today())
+        if key != self.key:
+            self.build(key[1])
+            self.key = key
+
+    def lookup(self, index, value):
+        return index.get(value, set()) | index.get(None, set())
+
+    def get_campaign_ids(self, client):
+        self.refresh()
+
+        candidates = sorted(
+            (
+                self.lookup(self.by_gender, client.gender),
+                self.lookup(self.by_location, client.location),
+                self.lookup(self.by_age_bucket, get_age_bucket(client.age)),
+            ),
+            key=len,
+        )
+        campaign_ids = candidates[0].intersection(*candidates[1:])
+
+        return {
+            campaign_id
+            for campaign_id in campaign_ids
+            if self.matches_age(campaign_id, client.age)
+        }
+
+    def matches_age(self, campaign_id, age):
+        age_from, age_to = self.targets[campaign_id]
+        return (age_from is None or age_from <= age) and (
+            age_to is None or age_to >= age
+        )
+
+
+targeting_index = TargetingIndex()
@@ -123,3 +123,28 @@ class TestCreateUpdateAdvertiser(APITestCase):
             self.advertiser_url + "00000000-0000-0000-0000-000000000000", format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_batch_is_not_saved(self):
+        data = [self.correct_advertiser_1, self.incorrect_advertisers[2]]
+        response = self.client.post(self.bulk_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Advertiser.objects.count(), 0)
+
+    def test_bulk_queries_do_not_grow_with_batch(self):
+        def make_batch(size):
+            return [
+                {"advertiser_id": str(uuid.uuid4()), "name": f"advertiser_{i}"}
+                for i in range(size)
+            ]
+
+        small_batch = make_batch(2)
+        self.client.post(self.bulk_url, data=small_batch, format="json")
+        with self.assertNumQueries(3):
+            self.client.post(self.bulk_url, data=small_batch, format="json")
+
+        large_batch = small_batch + make_batch(200)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.bulk_url, data=large_batch, format="json")
+
+        self.assertEqual(response.data, large_batch)
+        self.assertEqual(Advertiser.objects.count(), 202)
@@ -1,9 +1,10 @@
 from rest_framework.test import APITestCase
 from rest_framework import status
 from advertisers.models import Advertiser, Campaign, Target
+from core.testing import QueryCountTestMixin
 
 
-class CampaignViewSetTestCase(APITestCase):
+class CampaignViewSetTestCase(QueryCountTestMixin, APITestCase):
     def setUp(self):
         self.advertiser = Advertiser.objects.create(name="Test Advertiser")
         self.advertiser_id = self.advertiser.id
@@ -264,3 +265,98 @@ class CampaignViewSetTestCase(APITestCase):
         self.assertEqual(len(response.data), 5)
         for i, campaign in enumerate(response.data, start=6):
             self.assertEqual(f"Test Campaign {i}", campaign["ad_title"])
+
+    def create_campaigns(self, count):
+        for i in range(1, count + 1):
+            Campaign.objects.create(
+                advertiser=self.advertiser,
+                impressions_limit=1000,
+                clicks_limit=100,
+                cost_per_impression=0.5,
+                cost_per_click=5,
+                ad_title=f"Test Campaign {i}",
+                ad_text="This is a test campaign",
+                start_date=1609459200,
+                end_date=1609545600,
+            )
+
+    def test_list_campaigns_cursor_pagination(self):
+        self.create_campaigns(12)
+
+        titles = []
+        url = f"{self.base_url}?size=5"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [campaign["ad_title"] for campaign in response.data]
+
+            link = response.headers.get("Link")
+            url = link[1 : link.index(">")] if link else None
+            if url:
+                self.assertIn("cursor=", url)
+
+        self.assertEqual(titles, [f"Test Campaign {i}" for i in range(1, 13)])
+
+    def test_list_campaigns_does_not_count(self):
+        self.create_campaigns(3)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.base_url, {"size": 2})
+        self.assertEqual(len(response.data), 2)
+        self.assertIn('rel="next"', response.headers["Link"])
+
+    def test_list_campaigns_invalid_cursor_or_page(self):
+        self.create_campaigns(3)
+        for params in [{"cursor": "invalid"}, {"page": 3, "size": 2}, {"page": 0}]:
+            with self.subTest(params=params):
+                response = self.client.get(self.base_url, params)
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def create_targeted_campaigns(self, count):
+        for i in range(count):
+            Campaign.objects.create(
+                advertiser=self.advertiser,
+                impressions_limit=1000,
+                clicks_limit=100,
+                cost_per_impression=0.5,
+                cost_per_click=5,
+                ad_title=f"Targeted Campaign {i}",
+                ad_text="This is a test campaign",
+                start_date=1609459200,
+                end_date=1609545600,
+                targeting=Target.objects.create(gender="MALE", age_from=18),
+            )
+
+    def test_list_campaigns_queries_do_not_grow(self):
+        self.create_targeted_campaigns(2)
+        queries = self.assertQueriesDoNotGrow(
+            lambda: self.client.get(self.base_url, {"size": 20}),
+            lambda: self.create_targeted_campaigns(5),
+        )
+        self.assertEqual(queries, 2)
+
+    def test_campaign_endpoints_query_budget(self):
+        self.create_targeted_campaigns(10)
+        with self.assertQueryBudget(2):
+            self.client.get(self.base_url, {"size": 20})
+
+        data = {
+            "impressions_limit": 1000,
+            "clicks_limit": 100,
+            "cost_per_impression": 0.5,
+            "cost_per_click": 5,
+            "ad_title": "Test Campaign",
+            "ad_text": "This is a test campaign",
+            "start_date": 1609459200,
+            "end_date": 1609545600,
+            "targeting": {"gender": "MALE", "age_from": 20},
+        }
+        with self.assertQueryBudget(9):
+            response = self.client.post(self.base_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_retrieve_campaign_queries(self):
+        self.create_targeted_campaigns(1)
+        campaign = Campaign.objects.get()
+        with self.assertNumQueries(2):
+            response = self.client.get(f"{self.base_url}/{campaign.id}")
+        self.assertEqual(response.data["targeting"], {"gender": "MALE", "age_from": 18})
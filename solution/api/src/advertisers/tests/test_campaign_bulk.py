@@ -0,0 +1,146 @@
+import threading
+from unittest import mock
+
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign, ModerationTask, Target
+from clients.models import Client
+from conf import settings
+from core.testing import QueryCountTestMixin
+
+
+class CampaignBulkCreateTestCase(QueryCountTestMixin, APITestCase):
+    def setUp(self):
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.url = f"/advertisers/{self.advertiser.id}/campaigns/bulk"
+
+    def get_campaign_data(self, index, **kwargs):
+        return {
+            "impressions_limit": 100,
+            "clicks_limit": 10,
+            "cost_per_impression": 1,
+            "cost_per_click": 2,
+            "ad_title": f"title {index}",
+            "ad_text": f"text {index}",
+            "start_date": 0,
+            "end_date": 10,
+            **kwargs,
+        }
+
+    def test_create_campaigns(self):
+        data = [
+            self.get_campaign_data(0, targeting={"gender": "MALE", "age_from": 18}),
+            self.get_campaign_data(1),
+        ]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [campaign["ad_title"] for campaign in response.data],
+            ["title 0", "title 1"],
+        )
+        self.assertEqual(
+            response.data[0]["targeting"], {"gender": "MALE", "age_from": 18}
+        )
+        self.assertEqual(Campaign.objects.count(), 2)
+        self.assertEqual(Target.objects.get().campaign.ad_title, "title 0")
+
+        client = Client.objects.create(login="c", age=20, location="A", gender="MALE")
+        response = self.client.get(f"/ads?client_id={client.id}")
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_item_is_reported_by_index(self):
+        data = [
+            self.get_campaign_data(0),
+            self.get_campaign_data(1, impressions_limit=-1),
+            "campaign",
+        ]
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data["errors"]), {1, 2})
+        self.assertFalse(Campaign.objects.exists())
+
+    def test_not_a_list(self):
+        response = self.client.post(self.url, self.get_campaign_data(0), format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_advertiser_not_found(self):
+        response = self.client.post(
+            "/advertisers/00000000-0000-0000-0000-000000000000/campaigns/bulk",
+            [self.get_campaign_data(0)],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_llm_calls_run_concurrently(self):
+        data = [
+            self.get_campaign_data(index, ad_text=None, description_prompt="prompt")
+            for index in range(3)
+        ]
+        for item in data:
+            item.pop("ad_text")
+        barrier = threading.Barrier(len(data), timeout=5)
+
+        def generate_ad_text(description, title, company_name):
+            barrier.wait()
+            return f"{company_name}: {title}", True
+
+        with mock.patch(
+            "advertisers.serializers.generate_ad_text", side_effect=generate_ad_text
+        ):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [campaign["ad_text"] for campaign in response.data],
+            [f"Test Advertiser: title {index}" for index in range(3)],
+        )
+
+    def test_rejected_moderation_saves_nothing(self):
+        data = [
+            self.get_campaign_data(0, moderate_ad_text=True),
+            self.get_campaign_data(1, ad_text="bad", moderate_ad_text=True),
+        ]
+        with mock.patch(
+            "advertisers.serializers.moderate",
+            side_effect=lambda text: {
+                "passed": text != "bad",
+                "detail": "Absolutely unreadable ad_text",
+            },
+        ):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["errors"],
+            {1: {"non_field_errors": ["Absolutely unreadable ad_text"]}},
+        )
+        self.assertFalse(Campaign.objects.exists())
+
+    def test_async_moderation_enqueues_tasks(self):
+        data = [self.get_campaign_data(index) for index in range(3)]
+        with mock.patch.multiple(
+            settings, ASYNC_MODERATION=True, MODERATE_AD_TEXT=True
+        ):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(ModerationTask.objects.count(), 3)
+        self.assertEqual(
+            {campaign["moderation_status"] for campaign in response.data}, {"PENDING"}
+        )
+
+    def test_queries_do_not_grow_with_batch(self):
+        self.client.post(self.url, [self.get_campaign_data(0)], format="json")
+
+        data = [self.get_campaign_data(index) for index in range(20)]
+        with self.assertNumQueries(9):
+            response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, 201)
+
+    def test_bulk_create_query_budget(self):
+        data = [self.get_campaign_data(index) for index in range(20)]
+        with self.assertQueryBudget(11):
+            response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, 201)
@@ -0,0 +1,165 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from advertisers.llm_integration import (
+    GigaChatProvider,
+    generate_ad_text,
+    llm_provider,
+    moderate,
+    prefilter_moderation,
+)
+from advertisers.models import LLMCache
+from conf import settings
+
+
+class GigaChatProviderTest(SimpleTestCase):
+    def test_client_is_created_on_first_chat(self):
+        provider = GigaChatProvider()
+        self.assertIsNone(provider.client)
+
+        with mock.patch("gigachat.GigaChat") as gigachat:
+            chat = gigachat.return_value.chat
+            chat.return_value.choices = [mock.Mock(message=mock.Mock(content="ok"))]
+
+            self.assertEqual(provider.chat("first"), "ok")
+            self.assertEqual(provider.chat("second"), "ok")
+
+        gigachat.assert_called_once()
+        self.assertEqual(chat.call_count, 2)
+
+
+class LLMCacheTest(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            llm_provider, "chat", return_value='{"passed": true, "detail": null}'
+        )
+        self.chat = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_moderation_is_cached(self):
+        self.assertEqual(moderate("text"), {"passed": True, "detail": None})
+        self.assertEqual(moderate("text"), {"passed": True, "detail": None})
+        self.assertEqual(self.chat.call_count, 1)
+
+        moderate("other text")
+        self.assertEqual(self.chat.call_count, 2)
+
+    def test_uninterpretable_response_is_not_cached(self):
+        self.chat.return_value = "not json"
+        self.assertEqual(
+            moderate("text"),
+            {
+                "passed": False,
+                "detail": "LLM could not interpret your ad_text, it is incorrect",
+            },
+        )
+        self.assertFalse(LLMCache.objects.exists())
+
+        self.chat.return_value = '{"passed": true, "detail": null}'
+        self.assertEqual(moderate("text"), {"passed": True, "detail": None})
+        self.assertEqual(self.chat.call_count, 2)
+
+    def test_generation_is_cached_by_all_inputs(self):
+        self.chat.return_value = "Текст объявления"
+        self.assertEqual(
+            list(generate_ad_text("description", "title", "company")),
+            ["Текст объявления", True],
+        )
+        text, correct = generate_ad_text("description", "title", "company")
+        self.assertEqual((text, correct), ("Текст объявления", True))
+        self.assertEqual(self.chat.call_count, 1)
+
+        generate_ad_text("description", "title", "other company")
+        self.assertEqual(self.chat.call_count, 2)
+
+    def test_expired_response_is_refreshed(self):
+        moderate("text")
+        LLMCache.objects.update(
+            created_at=timezone.now()
+            - timedelta(seconds=settings.LLM_CACHE_TTL_SECONDS + 1)
+        )
+
+        moderate("text")
+        self.assertEqual(self.chat.call_count, 2)
+        self.assertEqual(LLMCache.objects.count(), 1)
+
+    def test_oldest_responses_are_evicted(self):
+        with mock.patch.object(settings, "LLM_CACHE_MAX_SIZE", 2):
+            for text in ["first", "second", "third"]:
+                moderate(text)
+            self.assertEqual(LLMCache.objects.count(), 2)
+
+            moderate("third")
+            self.assertEqual(self.chat.call_count, 3)
+            moderate("first")
+            self.assertEqual(self.chat.call_count, 4)
+
+    def test_cache_can_be_disabled(self):
+        with mock.patch.object(settings, "LLM_CACHE_MAX_SIZE", 0):
+            moderate("text")
+            moderate("text")
+
+        self.assertEqual(self.chat.call_count, 2)
+        self.assertFalse(LLMCache.objects.exists())
+
+
+class ModerationPrefilterTest(TestCase):
+    def test_clear_violations_are_rejected_locally(self):
+        cases = [
+            ("Пошел нахуй", "Presence of obscene language in the ad_text"),
+            ("Лучшая xуйня в городе", "Presence of obscene language in the ad_text"),
+            ("Fucking good prices", "Presence of obscene language in the ad_text"),
+            ("Заебись цены", "Presence of obscene language in the ad_text"),
+            ("Ебаные скидки", "Presence of obscene language in the ad_text"),
+            (
+                "Купи кокаин с доставкой",
+                "Drugs and prohibited substances in the ad_text",
+            ),
+            ("Cheap MDMA here", "Drugs and prohibited substances in the ad_text"),
+            ("#$%^&*()!@#", "Absolutely unreadable ad_text"),
+            ("   ", "Absolutely unreadable ad_text"),
+        ]
+        with mock.patch.object(llm_provider, "chat") as chat:
+            for text, detail in cases:
+                with self.subTest(text=text):
+                    self.assertEqual(
+                        moderate(text), {"passed": False, "detail": detail}
+                    )
+
+        chat.assert_not_called()
+
+    def test_ambiguous_texts_are_sent_to_llm(self):
+        texts = [
+            "Зоомагазин у дома, доступные цены, много товаров и акций",
+            "Учеба в лучшем вузе, победа и свежие хлеба",
+            "Героиня нового фильма в кино с 1 марта",
+            "Застрахуй машину у нас",
+            "Скидки 50% до 31.12 по телефону 8 800 555 35 35",
+            "Fresh heroine of the season",
+            "Test",
+            "Добро пожаловать в Ебург, лучшие экскурсии по городу",
+            "欢迎光临我们的商店，优质服务，价格实惠",
+            "მოგესალმებით ჩვენს მაღაზიაში",
+            "IT-курсы: SQL, HTML, CSS, JS, PHP",
+            "Ремонт ТВ, СВЧ, ПК",
+            "Мерч: XXL, XL, L, M, S",
+            "🔥🔥🔥🔥🔥🔥 Скидки!",
+            "Oxyelite pro",
+            "Гостиница Хуис тен Бос",
+            "профилактика кокаиновой зависимости",
+            "Анонимная помощь при зависимости от кокаина",
+            "ааааааааааааааааааа",
+            "йцукенгшщзхъфывпрлджэ",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertIsNone(prefilter_moderation(text))
+
+        with mock.patch.object(
+            llm_provider, "chat", return_value='{"passed": true, "detail": null}'
+        ) as chat:
+            self.assertTrue(moderate(texts[0])["passed"])
+        chat.assert_called_once()
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from advertisers import moderation
+from advertisers.models import Advertiser, Campaign, ModerationTask
+from advertisers.targeting import targeting_index
+from clients.models import Client
+from conf import settings
+
+
+class AsyncModerationTest(APITestCase):
+    def setUp(self):
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.url = f"/advertisers/{self.advertiser.id}/campaigns"
+        self.ad_client = Client.objects.create(
+            login="client", age=20, location="A", gender="MALE"
+        )
+
+        patchers = [
+            mock.patch.object(settings, "ASYNC_MODERATION", True),
+            mock.patch.object(settings, "MODERATE_AD_TEXT", True),
+            mock.patch.object(
+                moderation,
+                "moderate",
+                side_effect=lambda text: (
+                    {"passed": True, "detail": None}
+                    if text != "bad"
+                    else {"passed": False, "detail": "Absolutely unreadable ad_text"}
+                ),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_campaign(self, ad_text):
+        data = {
+            "impressions_limit": 100,
+            "clicks_limit": 100,
+            "cost_per_impression": 1,
+            "cost_per_click": 1,
+            "ad_title": "title",
+            "ad_text": ad_text,
+            "start_date": 0,
+            "end_date": 10,
+        }
+        return self.client.post(self.url, data, format="json")
+
+    def get_ad(self):
+        return self.client.get(f"/ads?client_id={self.ad_client.id}")
+
+    def test_create_returns_pending_campaign(self):
+        response = self.create_campaign("good")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["moderation_status"], "PENDING")
+
+        task = ModerationTask.objects.get()
+        self.assertEqual(task.ad_text, "good")
+        self.assertEqual(self.get_ad().status_code, 404)
+
+    def test_worker_approves_campaign(self):
+        response = self.create_campaign("good")
+        self.assertTrue(moderation.process_next_task())
+        self.assertFalse(moderation.process_next_task())
+
+        campaign = Campaign.objects.get()
+        self.assertEqual(campaign.moderation_status, "APPROVED")
+        self.assertFalse(ModerationTask.objects.exists())
+        self.assertEqual(self.get_ad().data["ad_id"], response.data["campaign_id"])
+
+    def test_worker_rejects_campaign(self):
+        response = self.create_campaign("bad")
+        moderation.process_next_task()
+
+        response = self.client.get(f"{self.url}/{response.data['campaign_id']}")
+        self.assertEqual(response.data["moderation_status"], "REJECTED")
+        self.assertEqual(
+            response.data["moderation_detail"], "Absolutely unreadable ad_text"
+        )
+        self.assertEqual(self.get_ad().status_code, 404)
+
+    def test_stale_result_is_not_applied(self):
+        self.create_campaign("bad")
+        task = moderation.claim_task()
+        campaign = Campaign.objects.get()
+        campaign.ad_text = "good"
+        campaign.save()
+        ModerationTask.enqueue(campaign)
+
+        moderation.process_task(task)
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.moderation_status, "PENDING")
+
+        moderation.process_next_task()
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.moderation_status, "APPROVED")
+        self.assertFalse(ModerationTask.objects.exists())
+
+    def test_expired_claim_is_retried(self):
+        self.create_campaign("good")
+        task = moderation.claim_task()
+        self.assertIsNone(moderation.claim_task())
+
+        ModerationTask.objects.filter(pk=task.pk).update(
+            claimed_at=timezone.now()
+            - timedelta(seconds=settings.MODERATION_TASK_TIMEOUT_SECONDS + 1)
+        )
+        self.assertEqual(moderation.claim_task().pk, task.pk)
+
+    def test_failed_moderation_keeps_task(self):
+        self.create_campaign("good")
+        with mock.patch.object(moderation, "moderate", side_effect=Exception):
+            with self.assertLogs("advertisers.moderation", "ERROR"):
+                self.assertTrue(moderation.process_next_task())
+
+        self.assertTrue(ModerationTask.objects.exists())
+        self.assertEqual(Campaign.objects.get().moderation_status, "PENDING")
+
+    def test_status_is_hidden_without_async_moderation(self):
+        with mock.patch.multiple(
+            settings, ASYNC_MODERATION=False, MODERATE_AD_TEXT=False
+        ):
+            response = self.create_campaign("good")
+
+        self.assertNotIn("moderation_status", response.data)
+        self.assertFalse(ModerationTask.objects.exists())
+        self.assertEqual(
+            targeting_index.get_campaign_ids(self.ad_client),
+            {Campaign.objects.get().pk},
+        )
@@ -0,0 +1,76 @@
+from django.test import TestCase
+
+from advertisers.models import Advertiser, Campaign, Target
+from advertisers.targeting import TargetingIndex
+from clients.models import Client
+from core.models import CacheVersion, CurrentDate
+
+
+class TargetingIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = TargetingIndex()
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.client_male = Client.objects.create(
+            login="male", age=25, location="Moscow", gender="MALE"
+        )
+        self.client_female = Client.objects.create(
+            login="female", age=67, location="Kazan", gender="FEMALE"
+        )
+
+    def create_campaign(self, start_date=0, end_date=10, **targeting):
+        return Campaign.objects.create(
+            advertiser=self.advertiser,
+            impressions_limit=10,
+            clicks_limit=10,
+            cost_per_impression=1,
+            cost_per_click=1,
+            ad_title="title",
+            ad_text="text",
+            start_date=start_date,
+            end_date=end_date,
+            targeting=Target.objects.create(**targeting) if targeting else None,
+        )
+
+    def test_candidates_match_targeting(self):
+        untargeted = self.create_campaign()
+        male = self.create_campaign(gender="MALE", age_from=20, age_to=29)
+        everyone = self.create_campaign(gender="ALL", age_from=60)
+        kazan = self.create_campaign(location="Kazan", age_to=70)
+        self.create_campaign(gender="FEMALE", location="Moscow")
+
+        self.assertEqual(
+            self.index.get_campaign_ids(self.client_male), {untargeted.id, male.id}
+        )
+        self.assertEqual(
+            self.index.get_campaign_ids(self.client_female),
+            {untargeted.id, everyone.id, kazan.id},
+        )
+
+    def test_rebuild_on_campaign_changes(self):
+        self.assertEqual(self.index.get_campaign_ids(self.client_male), set())
+
+        campaign = self.create_campaign(gender="MALE")
+        self.assertEqual(self.index.get_campaign_ids(self.client_male), {campaign.id})
+
+        campaign.targeting.gender = "FEMALE"
+        campaign.targeting.save()
+        self.assertEqual(self.index.get_campaign_ids(self.client_male), set())
+
+        campaign.delete()
+        self.assertEqual(self.index.get_campaign_ids(self.client_female), set())
+
+    def test_rebuild_on_date_change(self):
+        campaign = self.create_campaign(start_date=5, end_date=7)
+        self.assertEqual(self.index.get_campaign_ids(self.client_male), set())
+
+        CurrentDate.objects.create(current_date=6)
+        self.assertEqual(self.index.get_campaign_ids(self.client_male), {campaign.id})
+
+    def test_counter_updates_keep_index(self):
+        campaign = self.create_campaign()
+        version = CacheVersion.get_version(TargetingIndex.version_name)
+
+        campaign.impressions_count += 1
+        campaign.save(update_fields=["impressions_count"])
+
+        self.assertEqual(CacheVersion.get_version(TargetingIndex.version_name), version)
@@ -6,6 +6,11 @@ router = NoTrailingSlashRouter()
 router.register(r"campaigns", views.CampaignViewSet, basename="campaigns")
 
 urlpatterns = [
+    path(
+        "<uuid:advertiserId>/campaigns/bulk",
+        views.CampaignBulkCreateAPIView.as_view(),
+        name="campaigns-bulk",
+    ),
     path("<uuid:advertiserId>/", include(router.urls)),
     path(
         "<uuid:advertiserId>",
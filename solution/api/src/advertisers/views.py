@@ -1,14 +1,27 @@
-from rest_framework import viewsets
-from rest_framework.generics import RetrieveAPIView, get_object_or_404
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from django.db import connection, transaction
+from rest_framework import serializers, status, viewsets
+from rest_framework.generics import (
+    GenericAPIView,
+    RetrieveAPIView,
+    get_object_or_404,
+)
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
-from advertisers.models import Advertiser, Campaign
+from advertisers.models import Advertiser, Campaign, ModerationTask, Target
 from advertisers.serializers import (
     AdvertiserSerializer,
     CampaignSerializer,
 )
+from advertisers.targeting import targeting_index
+from core.metrics import track_queries
+from core.paginations import KeysetPagination
+from core.parsers import ORJSONParser
 from core.views import BulkCreateUpdateAPIView
+from conf import settings
 from conf.settings import MULTI_PART_DATA_FOR_CAMPAIGN
 
 
@@ -20,29 +33,31 @@ class AdvertiserRetrieveAPIView(RetrieveAPIView):
 
 class AdvertiserMassCreateUpdateAPIView(BulkCreateUpdateAPIView):
     serializer_class = AdvertiserSerializer
-    pk_field_name = "advertiser_id"
 
 
 class CampaignViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "post", "put", "delete"]
     lookup_url_kwarg = "campaignId"
     serializer_class = CampaignSerializer
+    pagination_class = KeysetPagination
     if MULTI_PART_DATA_FOR_CAMPAIGN:
         parser_classes = [MultiPartParser]
 
     def get_queryset(self):
         advertiser_id = self.kwargs["advertiserId"]
         advertiser = get_object_or_404(Advertiser, pk=advertiser_id)
-        return Campaign.objects.filter(advertiser=advertiser)
+        campaigns = Campaign.objects.filter(advertiser=advertiser).select_related(
+            "targeting"
+        )
+        if MULTI_PART_DATA_FOR_CAMPAIGN:
+            campaigns = campaigns.prefetch_related("images")
+        return campaigns
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context["advertiser_id"] = self.kwargs["advertiserId"]
         return context
 
-    def get_paginated_response(self, data):
-        return Response(data)
-
     def get_serializer_context(self):
         return {
             "request": self.request,
@@ -50,3 +65,86 @@ class CampaignViewSet(viewsets.ModelViewSet):
             "view": self,
             "advertiser_id": self.kwargs["advertiserId"],
         }
+
+
+class CampaignBulkCreateAPIView(GenericAPIView):
+    serializer_class = CampaignSerializer
+    parser_classes = [ORJSONParser]
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["advertiser_id"] = self.kwargs["advertiserId"]
+        context["advertiser"] = self.advertiser
+        context["defer_llm_checks"] = True
+        return context
+
+    def post(self, request, *args, **kwargs):
+        self.advertiser = get_object_or_404(Advertiser, pk=self.kwargs["advertiserId"])
+        data = request.data
+        if not isinstance(data, list):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        serializers_list = [self.get_serializer(data=item) for item in data]
+        errors = {
+            index: serializer.errors
+            for index, serializer in enumerate(serializers_list)
+            if not serializer.is_valid()
+        }
+        if not errors:
+            errors = self.run_llm_checks(serializers_list)
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        campaigns = self.create_campaigns(
+            [serializer.validated_data for serializer in serializers_list]
+        )
+        response_data = self.get_serializer(campaigns, many=True).data
+        return Response(response_data, status=status.HTTP_201_CREATED)
+
+    def run_llm_checks(self, serializers_list):
+        with ThreadPoolExecutor(
+            max_workers=settings.CAMPAIGN_BULK_LLM_CONCURRENCY
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda context, serializer: context.run(
+                        self.run_serializer_llm_checks, serializer
+                    ),
+                    [copy_context() for _ in serializers_list],
+                    serializers_list,
+                )
+            )
+
+        return {index: error for index, error in enumerate(results) if error}
+
+    def run_serializer_llm_checks(self, serializer):
+        try:
+            with track_queries():
+                serializer.run_llm_checks(serializer.validated_data)
+        except serializers.ValidationError as exc:
+            return serializers.as_serializer_error(exc)
+        finally:
+            connection.close()
+
+    def create_campaigns(self, items):
+        targets = []
+        campaigns = []
+        for validated_data in items:
+            validated_data.pop("uploaded_images", None)
+            targeting_data = validated_data.pop("targeting", None)
+            if targeting_data:
+                validated_data["targeting"] = Target(**targeting_data)
+                targets.append(validated_data["targeting"])
+            campaigns.append(Campaign(advertiser=self.advertiser, **validated_data))
+
+        with transaction.atomic():
+            Target.objects.bulk_create(targets)
+            Campaign.objects.bulk_create(campaigns)
+            ModerationTask.objects.bulk_create(
+                ModerationTask(campaign=campaign, ad_text=campaign.ad_text)
+                for campaign in campaigns
+                if campaign.moderation_status == "PENDING"
+            )
+            targeting_index.invalidate()
+
+        return campaigns
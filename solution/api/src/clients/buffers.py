@@ -0,0 +1,126 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.db import close_old_connections
+
+from advertisers.models import Campaign
+from clients.models import Client, AdImpression
+from conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ImpressionBuffer:
+    def __init__(self, flush_interval_ms, max_size, max_flush_attempts):
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_size = max_size
+        self.max_flush_attempts = max_flush_attempts
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.flush_attempts = {}
+        self.last_flush = time.monotonic()
+        self.flusher = None
+        self.wakeup = threading.Event()
+
+    def add(self, campaign, client):
+        impression = AdImpression(
+            campaign=campaign, client=client, cost=campaign.cost_per_impression
+        )
+        with self.lock:
+            self.pending.setdefault((client.pk, campaign.pk), impression)
+            is_full = len(self.pending) >= self.max_size
+            is_due = time.monotonic() - self.last_flush >= self.flush_interval
+
+        self.start()
+        if is_full:
+            self.flush()
+        elif is_due:
+            self.wakeup.set()
+
+    def contains(self, campaign_id, client_id):
+        return (client_id, campaign_id) in self.pending
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.last_flush = time.monotonic()
+
+        if not pending:
+            return
+
+        try:
+            AdImpression.record_many(list(pending.values()))
+        except Exception:
+            logger.exception("Failed to flush %s ad impressions", len(pending))
+            self.requeue(pending)
+        else:
+            with self.lock:
+                for key in pending:
+                    self.flush_attempts.pop(key, None)
+
+    def requeue(self, pending):
+        try:
+            campaign_ids = set(
+                Campaign.objects.filter(
+                    pk__in={campaign_id for _, campaign_id in pending}
+                ).values_list("pk", flat=True)
+            )
+            client_ids = set(
+                Client.objects.filter(
+                    pk__in={client_id for client_id, _ in pending}
+                ).values_list("pk", flat=True)
+            )
+        except Exception:
+            logger.exception("Failed to check ad impressions before retry")
+        else:
+            pending = {
+                (client_id, campaign_id): impression
+                for (client_id, campaign_id), impression in pending.items()
+                if client_id in client_ids and campaign_id in campaign_ids
+            }
+
+        dropped = 0
+        with self.lock:
+            for key, impression in pending.items():
+                attempts = self.flush_attempts.get(key, 0) + 1
+                if attempts >= self.max_flush_attempts:
+                    self.flush_attempts.pop(key, None)
+                    dropped += 1
+                    continue
+
+                self.flush_attempts[key] = attempts
+                self.pending.setdefault(key, impression)
+
+        if dropped:
+            logger.error(
+                "Dropped %s ad impressions after %s failed flushes",
+                dropped,
+                self.max_flush_attempts,
+            )
+
+    def start(self):
+        if self.flusher is not None:
+            return
+
+        with self.lock:
+            if self.flusher is None:
+                self.flusher = threading.Thread(target=self.run, daemon=True)
+                self.flusher.start()
+                atexit.register(self.flush)
+
+    def run(self):
+        while True:
+            woken = self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            if woken or time.monotonic() - self.last_flush >= self.flush_interval:
+                close_old_connections()
+                self.flush()
+
+
+impression_buffer = ImpressionBuffer(
+    settings.IMPRESSION_BUFFER_FLUSH_INTERVAL_MS,
+    settings.IMPRESSION_BUFFER_MAX_SIZE,
+    settings.IMPRESSION_BUFFER_MAX_FLUSH_ATTEMPTS,
+)
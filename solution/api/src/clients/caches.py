@@ -0,0 +1,145 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+from clients.models import AdImpression, AdClick
+from conf import settings
+
+
+class CampaignPositions:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.positions = {}
+        self.next_position = 0
+
+    def get(self, campaign_id):
+        position = self.positions.get(campaign_id)
+        if position is None:
+            with self.lock:
+                position = self.positions.get(campaign_id)
+                if position is None:
+                    position = self.positions[campaign_id] = self.next_position
+                    self.next_position += 1
+
+        return position
+
+    def retain(self, campaign_ids):
+        with self.lock:
+            positions = {
+                campaign_id: position
+                for campaign_id, position in self.positions.items()
+                if campaign_id in campaign_ids
+            }
+            evicted = len(positions) < len(self.positions)
+            self.positions = positions
+
+        return evicted
+
+    def get_array(self, campaign_ids):
+        return array(
+            "q", sorted({self.get(campaign_id) for campaign_id in campaign_ids})
+        )
+
+
+def contains(positions, position):
+    index = bisect_left(positions, position)
+    return index < len(positions) and positions[index] == position
+
+
+def insert(positions, position):
+    index = bisect_left(positions, position)
+    if index == len(positions) or positions[index] != position:
+        positions.insert(index, position)
+
+
+class SeenCampaigns:
+    def __init__(self, positions, impressed, clicked):
+        self.positions = positions
+        self.loaded_at = time.monotonic()
+        self.impressed = positions.get_array(impressed)
+        self.clicked = positions.get_array(clicked)
+
+    def is_impressed(self, campaign_id):
+        return contains(self.impressed, self.positions.get(campaign_id))
+
+    def is_clicked(self, campaign_id):
+        return contains(self.clicked, self.positions.get(campaign_id))
+
+
+class SeenCampaignsCache:
+    def __init__(self, max_size, ttl_seconds):
+        self.max_size = max_size
+        self.ttl = ttl_seconds
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.positions = CampaignPositions()
+        self.retained_key = None
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def get(self, client_id):
+        with self.lock:
+            seen = self.entries.get(client_id)
+            if seen is not None and time.monotonic() - seen.loaded_at < self.ttl:
+                self.entries.move_to_end(client_id)
+                return seen
+
+        seen = SeenCampaigns(
+            self.positions,
+            AdImpression.objects.filter(client_id=client_id).values_list(
+                "campaign_id", flat=True
+            ),
+            AdClick.objects.filter(client_id=client_id).values_list(
+                "campaign_id", flat=True
+            ),
+        )
+        with self.lock:
+            self.entries[client_id] = seen
+            self.entries.move_to_end(client_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+        return seen
+
+    def retain(self, key, campaign_ids):
+        if key == self.retained_key:
+            return
+
+        with self.lock:
+            if key != self.retained_key:
+                self.retained_key = key
+                if self.positions.retain(campaign_ids):
+                    self.entries.clear()
+
+    def add_impression(self, campaign_id, client_id):
+        if not self.enabled:
+            return
+
+        position = self.positions.get(campaign_id)
+        with self.lock:
+            seen = self.entries.get(client_id)
+            if seen is not None:
+                insert(seen.impressed, position)
+
+    def add_click(self, campaign_id, client_id):
+        if not self.enabled:
+            return
+
+        position = self.positions.get(campaign_id)
+        with self.lock:
+            seen = self.entries.get(client_id)
+            if seen is not None:
+                insert(seen.clicked, position)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+seen_campaigns = SeenCampaignsCache(
+    settings.SEEN_CAMPAIGNS_CACHE_SIZE, settings.SEEN_CAMPAIGNS_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from advertisers.models import Campaign
+from advertisers.targeting import targeting_index
+from clients.models import AdClickArchive, AdImpressionArchive
+from core.models import CurrentDate
+
+
+class Command(BaseCommand):
+    help = "Move impressions and clicks of long ended campaigns to archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Archive campaigns that ended more than this many days ago",
+        )
+        parser.add_argument("--batch-size", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        ended_before = CurrentDate.get_today() - options["days"]
+        if Campaign.objects.filter(
+            end_date__lt=ended_before, events_archived=False
+        ).update(events_archived=True):
+            targeting_index.invalidate()
+        campaign_ids = Campaign.objects.filter(events_archived=True).values("pk")
+
+        for archive_model in [AdImpressionArchive, AdClickArchive]:
+            archived = archive_model.archive_campaigns(
+                campaign_ids, options["batch_size"]
+            )
+            self.stdout.write(
+                f"Archived {archived} {archive_model.event_model._meta.verbose_name_plural}"
+            )
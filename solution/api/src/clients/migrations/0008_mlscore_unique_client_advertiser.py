@@ -0,0 +1,37 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:44
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_ml_scores(apps, schema_editor):
+    MLScore = apps.get_model("clients", "MLScore")
+    duplicates = (
+        MLScore.objects.values("client", "advertiser")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        duplicate_ids = MLScore.objects.filter(
+            client=duplicate["client"], advertiser=duplicate["advertiser"]
+        ).values_list("id", flat=True)[1:]
+        MLScore.objects.filter(id__in=list(duplicate_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0009_campaign_created_at"),
+        ("clients", "0007_adclick_cost_adimpression_cost_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_ml_scores, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="mlscore",
+            constraint=models.UniqueConstraint(
+                fields=("client", "advertiser"),
+                name="unique_client_advertiser_ml_score",
+            ),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_events(apps, schema_editor):
+    for model_name in ["AdImpression", "AdClick"]:
+        model = apps.get_model("clients", model_name)
+        duplicates = (
+            model.objects.values("client", "campaign")
+            .annotate(count=Count("id"))
+            .filter(count__gt=1)
+        )
+        for duplicate in duplicates:
+            duplicate_ids = (
+                model.objects.filter(
+                    client=duplicate["client"], campaign=duplicate["campaign"]
+                )
+                .order_by("created_at")
+                .values_list("id", flat=True)[1:]
+            )
+            model.objects.filter(id__in=list(duplicate_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("advertisers", "0010_campaign_campaign_active_dates_idx"),
+        ("clients", "0008_mlscore_unique_client_advertiser"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_events, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="adclick",
+            index=models.Index(
+                fields=["campaign", "created_at"], name="click_campaign_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="adimpression",
+            index=models.Index(
+                fields=["campaign", "created_at"], name="impression_campaign_date_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="adclick",
+            constraint=models.UniqueConstraint(
+                fields=("client", "campaign"), name="unique_client_campaign_click"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="adimpression",
+            constraint=models.UniqueConstraint(
+                fields=("client", "campaign"), name="unique_client_campaign_impression"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="adclick",
+            name="campaign",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="advertisers.campaign",
+                verbose_name="Реклама",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="adclick",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="clients.client",
+                verbose_name="Клиент",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="adimpression",
+            name="campaign",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="advertisers.campaign",
+                verbose_name="Реклама",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="adimpression",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="clients.client",
+                verbose_name="Клиент",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="mlscore",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="clients.client",
+                verbose_name="Клиент",
+            ),
+        ),
+    ]
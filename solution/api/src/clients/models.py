@@ -1,7 +1,13 @@
-from django.db import models
+import functools
+import uuid
+
+from django.db import connection, models, transaction
+from django.db.models import F, Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from core.models import UUIDModel, CurrentDate
 from advertisers.models import Advertiser, Campaign
+from stats.models import CampaignDailyStats
 
 
 class Client(UUIDModel):
@@ -19,23 +25,244 @@ class MLScore(UUIDModel):
     advertiser = models.ForeignKey(
         Advertiser, on_delete=models.CASCADE, verbose_name="Рекламодатель"
     )
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, verbose_name="Клиент")
+    client = models.ForeignKey(
+        Client, on_delete=models.CASCADE, verbose_name="Клиент", db_index=False
+    )
     score = models.IntegerField("Оценка ML")
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["client", "advertiser"],
+                name="unique_client_advertiser_ml_score",
+            )
+        ]
+
+    @classmethod
+    def upsert_many(cls, ml_scores):
+        unique_ml_scores = {
+            (ml_score.client_id, ml_score.advertiser_id): ml_score
+            for ml_score in ml_scores
+        }
+        return cls.objects.bulk_create(
+            unique_ml_scores.values(),
+            update_conflicts=True,
+            unique_fields=["client", "advertiser"],
+            update_fields=["score"],
+        )
+
+
+def get_inserted_events(model, events):
+    return (
+        model.objects.filter(pk__in=[event.pk for event in events])
+        .values("campaign")
+        .annotate(count=Count("pk"), spent=Sum("cost"))
+    )
+
+
+def count_inserted(inserted_events):
+    return Coalesce(
+        Subquery(inserted_events.filter(campaign=OuterRef("pk")).values("count")), 0
+    )
+
+
+RECORD_CLICK_SQL = """
+WITH campaign AS (
+    SELECT id, cost_per_click FROM {campaign_table} WHERE id = %(campaign_id)s
+), client AS (
+    SELECT id FROM {client_table} WHERE id = %(client_id)s
+), impression AS (
+    SELECT 1 FROM {impression_table}
+    WHERE campaign_id = %(campaign_id)s AND client_id = %(client_id)s
+), inserted_click AS (
+    INSERT INTO {click_table} (id, campaign_id, client_id, created_at, cost)
+    SELECT
+        %(click_id)s,
+        campaign.id,
+        client.id,
+        COALESCE((SELECT "current_date" FROM {current_date_table} LIMIT 1), 0),
+        CAST(TRUNC(campaign.cost_per_click) AS integer)
+    FROM campaign, client
+    WHERE EXISTS (SELECT 1 FROM impression)
+    ON CONFLICT (client_id, campaign_id) DO NOTHING
+    RETURNING campaign_id, created_at, cost
+), updated_campaign AS (
+    UPDATE {campaign_table} SET clicks_count = clicks_count + 1
+    WHERE id IN (SELECT campaign_id FROM inserted_click)
+), updated_daily_stats AS (
+    INSERT INTO {daily_stats_table} AS daily_stats
+        (id, campaign_id, date, impressions, clicks, spent_impressions, spent_clicks)
+    SELECT %(daily_stats_id)s, campaign_id, created_at, 0, 1, 0, cost
+    FROM inserted_click
+    ON CONFLICT (campaign_id, date) DO UPDATE SET
+        clicks = daily_stats.clicks + EXCLUDED.clicks,
+        spent_clicks = daily_stats.spent_clicks + EXCLUDED.spent_clicks
+)
+SELECT
+    EXISTS (SELECT 1 FROM campaign),
+    EXISTS (SELECT 1 FROM client),
+    EXISTS (SELECT 1 FROM impression)
+"""
+
+
+@functools.cache
+def get_record_click_sql():
+    return RECORD_CLICK_SQL.format(
+        campaign_table=Campaign._meta.db_table,
+        client_table=Client._meta.db_table,
+        impression_table=AdImpression._meta.db_table,
+        click_table=AdClick._meta.db_table,
+        current_date_table=CurrentDate._meta.db_table,
+        daily_stats_table=CampaignDailyStats._meta.db_table,
+    )
+
 
 class AdClick(UUIDModel):
     campaign = models.ForeignKey(
-        Campaign, on_delete=models.CASCADE, verbose_name="Реклама"
+        Campaign, on_delete=models.CASCADE, verbose_name="Реклама", db_index=False
+    )
+    client = models.ForeignKey(
+        Client, on_delete=models.CASCADE, verbose_name="Клиент", db_index=False
     )
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, verbose_name="Клиент")
     created_at = models.IntegerField(default=CurrentDate.get_today)
     cost = models.IntegerField()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["client", "campaign"], name="unique_client_campaign_click"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["campaign", "created_at"], name="click_campaign_date_idx"
+            )
+        ]
+
+    @classmethod
+    def record(cls, campaign, client):
+        click = cls(campaign=campaign, client=client, cost=campaign.cost_per_click)
+        with transaction.atomic():
+            cls.objects.bulk_create([click], ignore_conflicts=True)
+            inserted_clicks = get_inserted_events(cls, [click])
+            Campaign.objects.filter(pk=campaign.pk).update(
+                clicks_count=F("clicks_count") + count_inserted(inserted_clicks)
+            )
+            CampaignDailyStats.add_events(
+                [click], inserted_clicks, "clicks", "spent_clicks"
+            )
+        return click
+
+    @classmethod
+    def record_if_impressed(cls, campaign_id, client_id):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    get_record_click_sql(),
+                    {
+                        "campaign_id": campaign_id,
+                        "client_id": client_id,
+                        "click_id": uuid.uuid4(),
+                        "daily_stats_id": uuid.uuid4(),
+                    },
+                )
+                return cursor.fetchone()
+
+        campaign = Campaign.objects.filter(pk=campaign_id).first()
+        client = Client.objects.filter(pk=client_id).first()
+        impressed = (
+            campaign is not None
+            and client is not None
+            and AdImpression.objects.filter(campaign=campaign, client=client).exists()
+        )
+        if impressed:
+            cls.record(campaign, client)
+        return campaign is not None, client is not None, impressed
+
 
 class AdImpression(UUIDModel):
     campaign = models.ForeignKey(
-        Campaign, on_delete=models.CASCADE, verbose_name="Реклама"
+        Campaign, on_delete=models.CASCADE, verbose_name="Реклама", db_index=False
+    )
+    client = models.ForeignKey(
+        Client, on_delete=models.CASCADE, verbose_name="Клиент", db_index=False
     )
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, verbose_name="Клиент")
     created_at = models.IntegerField(default=CurrentDate.get_today)
     cost = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["client", "campaign"], name="unique_client_campaign_impression"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["campaign", "created_at"], name="impression_campaign_date_idx"
+            )
+        ]
+
+    @classmethod
+    def record(cls, campaign, client):
+        impression = cls(
+            campaign=campaign, client=client, cost=campaign.cost_per_impression
+        )
+        cls.record_many([impression])
+        return impression
+
+    @classmethod
+    def record_many(cls, impressions):
+        campaign_ids = {impression.campaign_id for impression in impressions}
+        with transaction.atomic():
+            cls.objects.bulk_create(impressions, ignore_conflicts=True)
+            inserted_impressions = get_inserted_events(cls, impressions)
+            Campaign.objects.filter(pk__in=campaign_ids).update(
+                impressions_count=F("impressions_count")
+                + count_inserted(inserted_impressions)
+            )
+            CampaignDailyStats.add_events(
+                impressions, inserted_impressions, "impressions", "spent_impressions"
+            )
+
+
+class AdEventArchive(UUIDModel):
+    campaign = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, verbose_name="Реклама"
+    )
+    client = models.ForeignKey(
+        Client, on_delete=models.CASCADE, verbose_name="Клиент", db_index=False
+    )
+    created_at = models.IntegerField()
+    cost = models.IntegerField()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def archive_campaigns(cls, campaign_ids, batch_size):
+        archived = 0
+        while True:
+            with transaction.atomic():
+                events = list(
+                    cls.event_model.objects.filter(campaign__in=campaign_ids).values(
+                        "id", "campaign_id", "client_id", "created_at", "cost"
+                    )[:batch_size]
+                )
+                if not events:
+                    return archived
+
+                cls.objects.bulk_create(
+                    [cls(**event) for event in events], ignore_conflicts=True
+                )
+                cls.event_model.objects.filter(
+                    pk__in=[event["id"] for event in events]
+                ).delete()
+            archived += len(events)
+
+
+class AdClickArchive(AdEventArchive):
+    event_model = AdClick
+
+
+class AdImpressionArchive(AdEventArchive):
+    event_model = AdImpression
@@ -0,0 +1,75 @@
+import numpy as np
+
+ML_SCORE_WEIGHT = 0.1
+COMPLETION_WEIGHT = 0.2
+PROFIT_WEIGHT = 0.7
+
+RANKING_FIELDS = [
+    "cost_per_click",
+    "cost_per_impression",
+    "clicks_count",
+    "clicks_limit",
+    "impressions_count",
+    "impressions_limit",
+    "ml_score",
+    "impressed",
+    "clicked",
+]
+
+
+def load_columns(campaigns):
+    return {
+        field: np.fromiter(
+            (getattr(campaign, field) or 0 for campaign in campaigns),
+            dtype=np.float64,
+            count=len(campaigns),
+        )
+        for field in RANKING_FIELDS
+    }
+
+
+def get_fill_rate(count, limit):
+    safe_limit = np.where(limit == 0, 1, limit)
+    return np.where(limit == 0, 0, count * (1.0001 / safe_limit))
+
+
+def normalize(values, max_value, scale=1.0):
+    normalized = np.zeros_like(values)
+    if max_value != 0:
+        np.divide(values, scale * max_value, out=normalized, where=values != 0)
+    return normalized
+
+
+def get_final_scores(columns):
+    not_clicked = 1 - columns["clicked"]
+    not_impressed = 1 - columns["impressed"]
+
+    profit = (
+        columns["cost_per_click"] * not_clicked
+        + columns["cost_per_impression"] * not_impressed
+    )
+    completion = (
+        0.5
+        * (1 - get_fill_rate(columns["clicks_count"], columns["clicks_limit"]))
+        * not_clicked
+        + 0.5
+        * (
+            1
+            - get_fill_rate(columns["impressions_count"], columns["impressions_limit"])
+        )
+        * not_impressed
+    )
+    ml_score = columns["ml_score"]
+
+    return (
+        normalize(ml_score, ml_score.max()) * ML_SCORE_WEIGHT
+        + normalize(completion, completion.max(), 1.001) * COMPLETION_WEIGHT
+        + normalize(profit, profit.max()) * PROFIT_WEIGHT
+    )
+
+
+def get_best_campaign(campaigns):
+    if not campaigns:
+        return None
+    final_scores = get_final_scores(load_columns(campaigns))
+    return campaigns[int(np.argmax(final_scores))]
@@ -1,8 +1,7 @@
 from rest_framework import serializers
-from rest_framework.generics import get_object_or_404
 
 from advertisers.serializers import CampaignImageSerializer
-from advertisers.models import Advertiser, Campaign
+from advertisers.models import Campaign
 from clients.models import Client, MLScore
 from conf.settings import MULTI_PART_DATA_FOR_CAMPAIGN
 from core.serializers import NotNullModelSerializerMixin
@@ -24,7 +23,7 @@ class ClientSerializer(NotNullModelSerializerMixin, serializers.ModelSerializer)
 
 class ClientAdSerializer(NotNullModelSerializerMixin, serializers.ModelSerializer):
     ad_id = serializers.UUIDField(source="id")
-    advertiser_id = serializers.UUIDField(source="advertiser.id")
+    advertiser_id = serializers.UUIDField(read_only=True)
     if MULTI_PART_DATA_FOR_CAMPAIGN:
         images = CampaignImageSerializer(many=True, read_only=True)
 
@@ -47,6 +46,36 @@ class ClientAdSerializer(NotNullModelSerializerMixin, serializers.ModelSerialize
         return repr
 
 
+def get_image_url(image, request=None):
+    if not image:
+        return None
+    try:
+        url = image.url
+    except AttributeError:
+        return None
+    if request is not None:
+        return request.build_absolute_uri(url)
+    return url
+
+
+def build_client_ad(campaign, request=None):
+    client_ad = {
+        "ad_id": str(campaign.id),
+        "ad_title": campaign.ad_title,
+        "ad_text": campaign.ad_text,
+        "advertiser_id": str(campaign.advertiser_id),
+    }
+    if MULTI_PART_DATA_FOR_CAMPAIGN:
+        images = [
+            get_image_url(campaign_image.image, request)
+            for campaign_image in campaign.images.all()
+        ]
+        if images:
+            client_ad["images"] = images
+
+    return client_ad
+
+
 class MLScoreCreateSerializer(serializers.ModelSerializer):
     client_id = serializers.UUIDField()
     advertiser_id = serializers.UUIDField()
@@ -56,20 +85,13 @@ class MLScoreCreateSerializer(serializers.ModelSerializer):
         fields = ["client_id", "advertiser_id", "score"]
 
     def create(self, validated_data):
-
-        score = validated_data.pop("score")
-
-        client = get_object_or_404(Client, pk=validated_data.pop("client_id"))
-        advertiser = get_object_or_404(
-            Advertiser, pk=validated_data.pop("advertiser_id")
+        ml_score = MLScore(
+            client_id=validated_data["client_id"],
+            advertiser_id=validated_data["advertiser_id"],
+            score=validated_data["score"],
         )
-
-        existed_ml_score = MLScore.objects.filter(client=client, advertiser=advertiser)
-
-        if existed_ml_score.exists():
-            return existed_ml_score.update(score=score)
-
-        return MLScore.objects.create(client=client, advertiser=advertiser, score=score)
+        MLScore.upsert_many([ml_score])
+        return ml_score
 
 
 class AdClickSerializer(serializers.Serializer):
@@ -2,9 +2,11 @@ import uuid
 from rest_framework.test import APITestCase
 
 from advertisers.models import Campaign, Advertiser
+from clients.models import AdImpression
+from core.testing import QueryCountTestMixin
 
 
-class TargetingTestCase(APITestCase):
+class TargetingTestCase(QueryCountTestMixin, APITestCase):
     def setUp(self):
         response_advertisers = self.client.post(
             "/advertisers/bulk",
@@ -94,3 +96,32 @@ class TargetingTestCase(APITestCase):
             f"/ads?client_id={self.first_client['client_id']}"
         ).data
         self.assertEqual(response["ad_id"], str(campaign2.id))
+
+    def test_ad_queries_do_not_grow_with_candidates(self):
+        url = f"/ads?client_id={self.first_client['client_id']}"
+
+        def add_campaigns(count):
+            for _ in range(count):
+                self.create_campaign(self.advertiser_2, impressions_limit=10)
+            self.client.get(url)
+            AdImpression.objects.all().delete()
+
+        add_campaigns(1)
+        self.assertQueriesDoNotGrow(
+            lambda: self.client.get(url), lambda: add_campaigns(5)
+        )
+
+    def test_ad_query_budget(self):
+        for advertiser in [self.advertiser_1, self.advertiser_2]:
+            for _ in range(3):
+                self.create_campaign(advertiser, impressions_limit=10)
+            self.set_ml_score(advertiser, self.first_client, 5)
+
+        warm_up = self.client.get(f"/ads?client_id={self.second_client['client_id']}")
+        self.assertEqual(warm_up.status_code, 200)
+
+        with self.assertQueryBudget(9):
+            response = self.client.get(
+                f"/ads?client_id={self.first_client['client_id']}"
+            )
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,94 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign
+from clients.models import (
+    Client,
+    AdClick,
+    AdImpression,
+    AdClickArchive,
+    AdImpressionArchive,
+)
+from stats.models import CampaignDailyStats
+
+
+class ArchiveEventsTest(APITestCase):
+    def setUp(self):
+        advertiser = Advertiser.objects.create(name="advertiser")
+        self.ended_campaign = self.create_campaign(advertiser, end_date=5)
+        self.active_campaign = self.create_campaign(advertiser, end_date=100)
+        self.clients = [
+            Client.objects.create(
+                login=f"user_{i}", age=20, location="A", gender="MALE"
+            )
+            for i in range(3)
+        ]
+        for campaign in [self.ended_campaign, self.active_campaign]:
+            for client in self.clients:
+                AdImpression.record(campaign, client)
+            AdClick.record(campaign, self.clients[0])
+
+        self.client.post("/time/advance", {"current_date": 40}, format="json")
+
+    def create_campaign(self, advertiser, end_date):
+        return Campaign.objects.create(
+            advertiser=advertiser,
+            impressions_limit=100,
+            clicks_limit=100,
+            cost_per_impression=2,
+            cost_per_click=3,
+            ad_title="title",
+            ad_text="text",
+            start_date=0,
+            end_date=end_date,
+        )
+
+    def archive(self, days):
+        call_command("archive_events", days=days, batch_size=2, stdout=StringIO())
+
+    def test_archives_only_long_ended_campaigns(self):
+        self.archive(days=35)
+        self.assertEqual(AdImpressionArchive.objects.count(), 0)
+
+        self.archive(days=30)
+        self.assertEqual(
+            set(AdImpression.objects.values_list("campaign", flat=True)),
+            {self.active_campaign.pk},
+        )
+        self.assertEqual(
+            set(AdClick.objects.values_list("campaign", flat=True)),
+            {self.active_campaign.pk},
+        )
+        self.assertEqual(
+            AdImpressionArchive.objects.filter(campaign=self.ended_campaign).count(), 3
+        )
+        self.assertEqual(
+            AdClickArchive.objects.filter(campaign=self.ended_campaign).count(), 1
+        )
+
+    def test_archived_campaign_is_not_shown_after_date_moves_back(self):
+        self.archive(days=30)
+        self.client.post("/time/advance", {"current_date": 3}, format="json")
+
+        for client in self.clients:
+            response = self.client.get(f"/ads?client_id={client.pk}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data["ad_id"], str(self.active_campaign.pk))
+
+        self.ended_campaign.refresh_from_db()
+        self.assertTrue(self.ended_campaign.events_archived)
+        self.assertEqual(self.ended_campaign.impressions_count, 3)
+        self.assertFalse(AdImpression.objects.filter(campaign=self.ended_campaign))
+
+    def test_stats_rebuild_includes_archived_events(self):
+        self.archive(days=30)
+        expected = list(CampaignDailyStats.objects.order_by("campaign").values())
+
+        call_command("rebuild_campaign_stats", stdout=StringIO())
+        actual = list(CampaignDailyStats.objects.order_by("campaign").values())
+
+        for row in expected + actual:
+            del row["id"]
+        self.assertEqual(actual, expected)
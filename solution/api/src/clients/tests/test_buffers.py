@@ -0,0 +1,138 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign
+from clients.buffers import ImpressionBuffer
+from clients.models import Client, AdImpression
+from conf import settings
+
+
+def create_campaign(advertiser, cost_per_impression=3):
+    return Campaign.objects.create(
+        advertiser=advertiser,
+        impressions_limit=100,
+        clicks_limit=100,
+        cost_per_impression=cost_per_impression,
+        cost_per_click=1,
+        ad_title="title",
+        ad_text="text",
+        start_date=0,
+        end_date=10,
+    )
+
+
+class ImpressionBufferTest(TestCase):
+    def setUp(self):
+        self.buffer = ImpressionBuffer(
+            flush_interval_ms=3600000, max_size=3, max_flush_attempts=2
+        )
+        self.addCleanup(lambda: self.buffer.pending.clear())
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.campaign = create_campaign(self.advertiser)
+        self.clients = [
+            Client.objects.create(
+                login=f"user_{i}", age=20, location="A", gender="MALE"
+            )
+            for i in range(3)
+        ]
+
+    def test_duplicates_are_merged(self):
+        self.buffer.add(self.campaign, self.clients[0])
+        self.buffer.add(self.campaign, self.clients[0])
+        self.assertTrue(self.buffer.contains(self.campaign.pk, self.clients[0].pk))
+        self.assertEqual(AdImpression.objects.count(), 0)
+
+        self.buffer.flush()
+        self.campaign.refresh_from_db()
+        self.assertEqual(AdImpression.objects.count(), 1)
+        self.assertEqual(self.campaign.impressions_count, 1)
+
+    def test_flush_on_max_size(self):
+        other_campaign = create_campaign(self.advertiser)
+        self.buffer.add(self.campaign, self.clients[0])
+        self.buffer.add(other_campaign, self.clients[0])
+        self.assertEqual(AdImpression.objects.count(), 0)
+
+        self.buffer.add(self.campaign, self.clients[1])
+        self.assertEqual(AdImpression.objects.count(), 3)
+        self.assertFalse(self.buffer.contains(self.campaign.pk, self.clients[0].pk))
+
+        self.campaign.refresh_from_db()
+        other_campaign.refresh_from_db()
+        self.assertEqual(self.campaign.impressions_count, 2)
+        self.assertEqual(other_campaign.impressions_count, 1)
+
+    def test_elapsed_interval_wakes_flusher(self):
+        self.buffer.flush_interval = 0
+        with mock.patch.object(self.buffer, "start"):
+            self.buffer.add(self.campaign, self.clients[0])
+        self.assertTrue(self.buffer.wakeup.is_set())
+        self.assertEqual(AdImpression.objects.count(), 0)
+
+    def test_failed_flush_keeps_impressions(self):
+        self.buffer.add(self.campaign, self.clients[0])
+        with mock.patch.object(AdImpression, "record_many", side_effect=Exception):
+            self.buffer.flush()
+        self.assertTrue(self.buffer.contains(self.campaign.pk, self.clients[0].pk))
+
+    def test_failing_impressions_are_dropped_after_max_attempts(self):
+        self.buffer.add(self.campaign, self.clients[0])
+        with mock.patch.object(AdImpression, "record_many", side_effect=Exception):
+            self.buffer.flush()
+            self.buffer.flush()
+        self.assertFalse(self.buffer.contains(self.campaign.pk, self.clients[0].pk))
+        self.assertEqual(self.buffer.flush_attempts, {})
+
+    def test_impressions_of_deleted_clients_are_not_retried(self):
+        self.buffer.add(self.campaign, self.clients[0])
+        self.buffer.add(self.campaign, self.clients[1])
+        self.clients[0].delete()
+        with mock.patch.object(AdImpression, "record_many", side_effect=Exception):
+            self.buffer.flush()
+        self.assertFalse(self.buffer.contains(self.campaign.pk, self.clients[0].pk))
+        self.assertTrue(self.buffer.contains(self.campaign.pk, self.clients[1].pk))
+
+        self.buffer.flush()
+        self.assertEqual(AdImpression.objects.count(), 1)
+        self.assertEqual(self.buffer.flush_attempts, {})
+
+
+class BufferedAdRetrieveTest(APITestCase):
+    def setUp(self):
+        self.buffer = ImpressionBuffer(
+            flush_interval_ms=3600000, max_size=100, max_flush_attempts=2
+        )
+        self.addCleanup(lambda: self.buffer.pending.clear())
+        patchers = [
+            mock.patch.object(settings, "BUFFER_AD_IMPRESSIONS", True),
+            mock.patch("clients.views.impression_buffer", self.buffer),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.client_obj = Client.objects.create(
+            login="user", age=20, location="A", gender="MALE"
+        )
+
+    def test_impression_is_buffered_until_click(self):
+        expensive = create_campaign(self.advertiser, cost_per_impression=10)
+        cheap = create_campaign(self.advertiser, cost_per_impression=5)
+
+        response = self.client.get(f"/ads?client_id={self.client_obj.id}")
+        self.assertEqual(response.data["ad_id"], str(expensive.id))
+        self.assertEqual(AdImpression.objects.count(), 0)
+
+        response = self.client.get(f"/ads?client_id={self.client_obj.id}")
+        self.assertEqual(response.data["ad_id"], str(cheap.id))
+
+        response = self.client.post(
+            f"/ads/{expensive.id}/click",
+            {"client_id": str(self.client_obj.id)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(AdImpression.objects.count(), 2)
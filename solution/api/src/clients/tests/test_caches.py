@@ -0,0 +1,162 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign
+from clients.caches import SeenCampaignsCache
+from clients.models import Client, AdImpression, AdClick
+
+
+def create_campaign(advertiser, cost_per_impression=1, cost_per_click=1):
+    return Campaign.objects.create(
+        advertiser=advertiser,
+        impressions_limit=100,
+        clicks_limit=100,
+        cost_per_impression=cost_per_impression,
+        cost_per_click=cost_per_click,
+        ad_title="title",
+        ad_text="text",
+        start_date=0,
+        end_date=10,
+    )
+
+
+class SeenCampaignsCacheTest(TestCase):
+    def setUp(self):
+        self.cache = SeenCampaignsCache(max_size=2, ttl_seconds=60)
+        advertiser = Advertiser.objects.create(name="advertiser")
+        self.campaigns = [create_campaign(advertiser) for _ in range(3)]
+        self.clients = [
+            Client.objects.create(
+                login=f"user_{i}", age=20, location="A", gender="MALE"
+            )
+            for i in range(3)
+        ]
+
+    def test_loads_seen_campaigns(self):
+        client = self.clients[0]
+        AdImpression.record(self.campaigns[0], client)
+        AdImpression.record(self.campaigns[1], client)
+        AdClick.record_if_impressed(self.campaigns[1].pk, client.pk)
+
+        with self.assertNumQueries(2):
+            seen = self.cache.get(client.pk)
+        with self.assertNumQueries(0):
+            self.assertIs(self.cache.get(client.pk), seen)
+
+        self.assertEqual(
+            [seen.is_impressed(campaign.pk) for campaign in self.campaigns],
+            [True, True, False],
+        )
+        self.assertEqual(
+            [seen.is_clicked(campaign.pk) for campaign in self.campaigns],
+            [False, True, False],
+        )
+
+    def test_writes_update_cached_entry(self):
+        client = self.clients[0]
+        seen = self.cache.get(client.pk)
+
+        self.cache.add_impression(self.campaigns[2].pk, client.pk)
+        self.cache.add_impression(self.campaigns[0].pk, client.pk)
+        self.cache.add_impression(self.campaigns[2].pk, client.pk)
+        self.cache.add_click(self.campaigns[2].pk, client.pk)
+
+        self.assertEqual(list(seen.impressed), sorted(seen.impressed))
+        self.assertEqual(len(seen.impressed), 2)
+        self.assertTrue(seen.is_impressed(self.campaigns[0].pk))
+        self.assertFalse(seen.is_impressed(self.campaigns[1].pk))
+        self.assertTrue(seen.is_clicked(self.campaigns[2].pk))
+
+    def test_writes_for_missing_client_are_ignored(self):
+        self.cache.add_impression(self.campaigns[0].pk, self.clients[0].pk)
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_disabled_cache_does_not_track_campaigns(self):
+        cache = SeenCampaignsCache(max_size=0, ttl_seconds=60)
+        cache.add_impression(self.campaigns[0].pk, self.clients[0].pk)
+        cache.add_click(self.campaigns[0].pk, self.clients[0].pk)
+        self.assertEqual(cache.positions.positions, {})
+
+    def test_inactive_campaigns_are_evicted(self):
+        client = self.clients[0]
+        AdImpression.record(self.campaigns[0], client)
+        seen = self.cache.get(client.pk)
+        old_position = self.cache.positions.get(self.campaigns[1].pk)
+
+        self.cache.retain("first", {self.campaigns[0].pk, self.campaigns[1].pk})
+        self.assertIs(self.cache.get(client.pk), seen)
+
+        self.cache.retain("second", {self.campaigns[1].pk})
+        self.assertEqual(list(self.cache.positions.positions), [self.campaigns[1].pk])
+        self.assertEqual(len(self.cache.entries), 0)
+
+        self.assertTrue(self.cache.get(client.pk).is_impressed(self.campaigns[0].pk))
+        self.assertNotIn(
+            self.cache.positions.get(self.campaigns[0].pk), {0, old_position}
+        )
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.get(self.clients[0].pk)
+        self.cache.get(self.clients[1].pk)
+        self.cache.get(self.clients[0].pk)
+        self.cache.get(self.clients[2].pk)
+
+        self.assertEqual(
+            list(self.cache.entries), [self.clients[0].pk, self.clients[2].pk]
+        )
+
+    def test_expired_entry_is_reloaded(self):
+        client = self.clients[0]
+        self.cache.ttl = 0
+        self.cache.get(client.pk)
+        AdImpression.record(self.campaigns[0], client)
+
+        with self.assertNumQueries(2):
+            seen = self.cache.get(client.pk)
+        self.assertTrue(seen.is_impressed(self.campaigns[0].pk))
+
+
+class SeenCampaignsViewTest(APITestCase):
+    def setUp(self):
+        advertiser = Advertiser.objects.create(name="advertiser")
+        self.campaigns = [
+            create_campaign(advertiser, cost_per_impression=5, cost_per_click=1),
+            create_campaign(advertiser, cost_per_impression=1, cost_per_click=20),
+            create_campaign(advertiser, cost_per_impression=2, cost_per_click=2),
+        ]
+        self.ad_client = Client.objects.create(
+            login="client", age=20, location="A", gender="MALE"
+        )
+
+    def show_and_click(self):
+        ad_ids = []
+        for _ in range(4):
+            ad_id = self.client.get(f"/ads?client_id={self.ad_client.pk}").data["ad_id"]
+            self.client.post(
+                f"/ads/{ad_id}/click",
+                {"client_id": str(self.ad_client.pk)},
+                format="json",
+            )
+            ad_ids.append(ad_id)
+
+        return ad_ids
+
+    def test_same_ads_as_without_cache(self):
+        expected = self.show_and_click()
+        AdClick.objects.all().delete()
+        AdImpression.objects.all().delete()
+        Campaign.objects.update(impressions_count=0, clicks_count=0)
+
+        cache = SeenCampaignsCache(max_size=10, ttl_seconds=60)
+        with mock.patch("clients.views.seen_campaigns", cache):
+            self.assertEqual(self.show_and_click(), expected)
+
+        seen = cache.get(self.ad_client.pk)
+        self.assertTrue(
+            all(seen.is_impressed(campaign.pk) for campaign in self.campaigns)
+        )
+        self.assertTrue(
+            all(seen.is_clicked(campaign.pk) for campaign in self.campaigns)
+        )
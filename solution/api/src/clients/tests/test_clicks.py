@@ -0,0 +1,95 @@
+import uuid
+from unittest import skipUnless
+
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign
+from clients.models import AdClick, AdImpression, Client
+from stats.models import CampaignDailyStats
+
+
+class AdClickViewTest(APITestCase):
+    def setUp(self):
+        advertiser = Advertiser.objects.create(name="advertiser")
+        self.campaign = Campaign.objects.create(
+            advertiser=advertiser,
+            impressions_limit=10,
+            clicks_limit=10,
+            cost_per_impression=1,
+            cost_per_click=3.7,
+            ad_title="title",
+            ad_text="text",
+            start_date=0,
+            end_date=10,
+        )
+        self.ad_client = Client.objects.create(
+            login="client", age=20, location="A", gender="MALE"
+        )
+        self.url = f"/ads/{self.campaign.id}/click"
+
+    def click(self, url=None, client_id=None):
+        return self.client.post(
+            url or self.url,
+            {"client_id": str(client_id or self.ad_client.id)},
+            format="json",
+        )
+
+    def test_click_after_impression(self):
+        AdImpression.record(self.campaign, self.ad_client)
+
+        self.assertEqual(self.click().status_code, 204)
+        self.assertEqual(self.click().status_code, 204)
+
+        click = AdClick.objects.get()
+        self.assertEqual((click.cost, click.created_at), (3, 0))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.clicks_count, 1)
+        daily_stats = CampaignDailyStats.objects.get(campaign=self.campaign)
+        self.assertEqual((daily_stats.clicks, daily_stats.spent_clicks), (1, 3))
+
+    def test_click_without_impression(self):
+        self.assertEqual(self.click().status_code, 403)
+        self.assertFalse(AdClick.objects.exists())
+
+    def test_not_found(self):
+        self.assertEqual(self.click(client_id=uuid.uuid4()).status_code, 404)
+        self.assertEqual(self.click(url=f"/ads/{uuid.uuid4()}/click").status_code, 404)
+
+    def test_invalid_body(self):
+        response = self.client.post(self.url, {"client_id": "1"}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(
+            f"/ads/{uuid.uuid4()}/click", {"client_id": "1"}, format="json"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    @skipUnless(connection.vendor == "postgresql", "single statement click path")
+    def test_click_is_one_query(self):
+        AdImpression.record(self.campaign, self.ad_client)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.click().status_code, 204)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.click().status_code, 204)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.clicks_count, 1)
+        daily_stats = CampaignDailyStats.objects.get(campaign=self.campaign)
+        self.assertEqual(
+            (
+                daily_stats.impressions,
+                daily_stats.clicks,
+                daily_stats.spent_impressions,
+                daily_stats.spent_clicks,
+            ),
+            (1, 1, 1, 3),
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "single statement click path")
+    def test_rejected_click_is_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.click().status_code, 403)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.click(client_id=uuid.uuid4()).status_code, 404)
+        self.assertFalse(CampaignDailyStats.objects.filter(clicks__gt=0).exists())
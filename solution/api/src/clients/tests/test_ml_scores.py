@@ -0,0 +1,133 @@
+import json
+import uuid
+from unittest import mock
+
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser
+from clients.models import Client, MLScore
+from clients.views import MlScoreBulkCreateUpdateView
+
+
+class MLScoreBulkTestCase(APITestCase):
+    def setUp(self):
+        self.bulk_url = "/ml-scores/bulk"
+        self.advertisers = [
+            Advertiser.objects.create(name=f"advertiser_{i}") for i in range(2)
+        ]
+        self.clients = [
+            Client.objects.create(
+                login=f"user_{i}", age=20, location="A", gender="MALE"
+            )
+            for i in range(2)
+        ]
+
+    def make_score(self, client, advertiser, score):
+        return {
+            "client_id": str(client.id),
+            "advertiser_id": str(advertiser.id),
+            "score": score,
+        }
+
+    def get_score(self, client, advertiser):
+        return MLScore.objects.get(client=client, advertiser=advertiser).score
+
+    def test_bulk_create_and_update(self):
+        MLScore.objects.create(
+            client=self.clients[0], advertiser=self.advertisers[0], score=1
+        )
+        data = [
+            self.make_score(self.clients[0], self.advertisers[0], 10),
+            self.make_score(self.clients[0], self.advertisers[1], 20),
+            self.make_score(self.clients[1], self.advertisers[0], 30),
+            self.make_score(self.clients[0], self.advertisers[1], 40),
+        ]
+        response = self.client.post(self.bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(MLScore.objects.count(), 3)
+        self.assertEqual(self.get_score(self.clients[0], self.advertisers[0]), 10)
+        self.assertEqual(self.get_score(self.clients[0], self.advertisers[1]), 40)
+        self.assertEqual(self.get_score(self.clients[1], self.advertisers[0]), 30)
+
+    def test_ndjson_stream(self):
+        lines = [
+            json.dumps(self.make_score(client, advertiser, 7))
+            for client in self.clients
+            for advertiser in self.advertisers
+        ]
+        response = self.client.post(
+            self.bulk_url,
+            "\n".join(lines) + "\n",
+            content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["saved"], 4)
+        self.assertEqual(MLScore.objects.filter(score=7).count(), 4)
+
+    def test_invalid_ndjson_line(self):
+        response = self.client.post(
+            self.bulk_url, "{not json}\n", content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_ndjson_line_after_saved_chunk(self):
+        lines = [
+            json.dumps(self.make_score(self.clients[0], self.advertisers[0], 10)),
+            "{not json}",
+        ]
+        with mock.patch.object(MlScoreBulkCreateUpdateView, "batch_size", 1):
+            response = self.client.post(
+                self.bulk_url,
+                "\n".join(lines) + "\n",
+                content_type="application/x-ndjson",
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["saved"], 1)
+        self.assertIn("line 2", response.data["detail"])
+        self.assertEqual(MLScore.objects.count(), 1)
+
+    def test_not_a_list(self):
+        for body in ["null", "5", '"text"', "{}"]:
+            with self.subTest(body=body):
+                response = self.client.post(
+                    self.bulk_url, body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+
+    def test_invalid_item(self):
+        data = [
+            self.make_score(self.clients[0], self.advertisers[0], 10),
+            {"client_id": str(self.clients[0].id), "score": 5},
+        ]
+        response = self.client.post(self.bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(1, response.data["errors"])
+        self.assertEqual(MLScore.objects.count(), 0)
+
+    def test_missing_client(self):
+        missing_client = Client(id=uuid.uuid4())
+        data = [
+            self.make_score(self.clients[0], self.advertisers[0], 10),
+            self.make_score(missing_client, self.advertisers[0], 10),
+        ]
+        response = self.client.post(self.bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data["client_id"], [missing_client.id])
+        self.assertEqual(MLScore.objects.count(), 0)
+
+    def test_chunks_are_committed_separately(self):
+        data = [
+            self.make_score(self.clients[0], self.advertisers[0], 10),
+            self.make_score(Client(id=uuid.uuid4()), self.advertisers[0], 10),
+        ]
+        with mock.patch.object(MlScoreBulkCreateUpdateView, "batch_size", 1):
+            response = self.client.post(self.bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data["saved"], 1)
+        self.assertEqual(MLScore.objects.count(), 1)
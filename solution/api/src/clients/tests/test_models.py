@@ -65,6 +65,21 @@ class AdClickModelTest(TestCase):
         self.assertEqual(ad_click.client, self.client)
         self.assertEqual(ad_click.cost, 10)
 
+    def test_adclick_record(self):
+        self.campaign.ad_title = "Stale Title"
+        ad_click = AdClick.record(self.campaign, self.client)
+        self.campaign.refresh_from_db()
+        self.assertEqual(ad_click.cost, 2)
+        self.assertEqual(self.campaign.clicks_count, 1)
+        self.assertEqual(self.campaign.ad_title, "Test Campaign")
+
+    def test_adclick_record_is_unique(self):
+        AdClick.record(self.campaign, self.client)
+        AdClick.record(self.campaign, self.client)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.clicks_count, 1)
+        self.assertEqual(AdClick.objects.count(), 1)
+
 
 class AdImpressionModelTest(TestCase):
     def setUp(self):
@@ -91,3 +106,30 @@ class AdImpressionModelTest(TestCase):
         self.assertEqual(ad_impression.campaign, self.campaign)
         self.assertEqual(ad_impression.client, self.client)
         self.assertEqual(ad_impression.cost, 5)
+
+    def test_adimpression_record(self):
+        AdImpression.record(self.campaign, self.client)
+        AdImpression.record(
+            self.campaign,
+            Client.objects.create(
+                login="other_user", age=30, location="Moscow", gender="FEMALE"
+            ),
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.impressions_count, 2)
+        self.assertEqual(AdImpression.objects.count(), 2)
+
+    def test_adimpression_record_many_skips_existing(self):
+        other_client = Client.objects.create(
+            login="other_user", age=30, location="Moscow", gender="FEMALE"
+        )
+        AdImpression.record(self.campaign, self.client)
+        AdImpression.record_many(
+            [
+                AdImpression(campaign=self.campaign, client=self.client, cost=1),
+                AdImpression(campaign=self.campaign, client=other_client, cost=1),
+            ]
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.impressions_count, 2)
+        self.assertEqual(AdImpression.objects.count(), 2)
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from clients.ranking import get_best_campaign, get_final_scores, load_columns
+
+
+def make_campaign(**fields):
+    defaults = {
+        "cost_per_click": 0,
+        "cost_per_impression": 0,
+        "clicks_count": 0,
+        "clicks_limit": 10,
+        "impressions_count": 0,
+        "impressions_limit": 10,
+        "ml_score": 0,
+        "impressed": False,
+        "clicked": False,
+    }
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+class RankingTestCase(SimpleTestCase):
+    def test_profit_dominates_score(self):
+        cheap = make_campaign(cost_per_impression=1, ml_score=100)
+        expensive = make_campaign(cost_per_impression=10, ml_score=1)
+        self.assertIs(get_best_campaign([cheap, expensive]), expensive)
+
+    def test_impressed_campaign_loses_impression_profit(self):
+        impressed = make_campaign(cost_per_impression=10, impressed=True)
+        fresh = make_campaign(cost_per_impression=5)
+        self.assertIs(get_best_campaign([impressed, fresh]), fresh)
+
+    def test_ml_score_breaks_equal_profit(self):
+        low = make_campaign(cost_per_click=5, ml_score=2)
+        high = make_campaign(cost_per_click=5, ml_score=8)
+        self.assertIs(get_best_campaign([low, high]), high)
+
+    def test_completion_prefers_less_filled_campaign(self):
+        filled = make_campaign(impressions_count=9, clicks_count=9)
+        empty = make_campaign()
+        self.assertIs(get_best_campaign([filled, empty]), empty)
+
+    def test_first_campaign_wins_tie(self):
+        campaigns = [make_campaign(), make_campaign()]
+        self.assertIs(get_best_campaign(campaigns), campaigns[0])
+
+    def test_zero_limits_and_scores(self):
+        campaign = make_campaign(clicks_limit=0, impressions_limit=0)
+        scores = get_final_scores(load_columns([campaign]))
+        self.assertAlmostEqual(scores[0], 0.2 / 1.001)
+
+    def test_empty_candidates(self):
+        self.assertIsNone(get_best_campaign([]))
+
+    def test_weights(self):
+        campaigns = [
+            make_campaign(cost_per_click=4, ml_score=10, clicks_count=5),
+            make_campaign(cost_per_click=2, ml_score=5, impressed=True),
+        ]
+        scores = get_final_scores(load_columns(campaigns))
+        self.assertAlmostEqual(scores[0], 0.1 + 0.2 / 1.001 + 0.7)
+        self.assertAlmostEqual(
+            scores[1], 0.05 + 0.2 * 0.5 / (1.001 * 0.749975) + 0.7 * 0.5
+        )
@@ -0,0 +1,45 @@
+import uuid
+
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+
+from advertisers.models import Campaign, CampaignImage
+from advertisers.serializers import CampaignImageSerializer
+from clients.serializers import ClientAdSerializer, build_client_ad, get_image_url
+
+
+class BuildClientAdTest(SimpleTestCase):
+    def setUp(self):
+        self.request = APIRequestFactory().get("/ads")
+
+    def test_matches_client_ad_serializer(self):
+        campaigns = [
+            Campaign(
+                id=uuid.uuid4(),
+                advertiser_id=uuid.uuid4(),
+                ad_title="title",
+                ad_text="Текст рекламы",
+            ),
+            Campaign(
+                id=uuid.uuid4(), advertiser_id=uuid.uuid4(), ad_title="", ad_text=""
+            ),
+        ]
+        for campaign in campaigns:
+            self.assertEqual(
+                build_client_ad(campaign, self.request),
+                ClientAdSerializer(campaign, context={"request": self.request}).data,
+            )
+
+    def test_image_url_matches_image_serializer(self):
+        images = [
+            CampaignImage(image="campaign_images/ad.png"),
+            CampaignImage(image=""),
+        ]
+        for image in images:
+            for request in [self.request, None]:
+                self.assertEqual(
+                    get_image_url(image.image, request),
+                    CampaignImageSerializer(image, context={"request": request}).data[
+                        "image"
+                    ],
+                )
@@ -1,31 +1,42 @@
-from django.db.models import Exists, OuterRef, F, Value, FloatField, Q, Max, Case, When
+from functools import cached_property
+from itertools import islice
+from types import GeneratorType
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, F, Value, FloatField, Q
 from django.db.models.functions import Coalesce
 from django.http import Http404
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (
     RetrieveAPIView,
     CreateAPIView,
     get_object_or_404,
     GenericAPIView,
 )
+from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 from rest_framework import status
 
 from advertisers.models import Advertiser, Campaign
+from advertisers.targeting import targeting_index
+from clients.buffers import impression_buffer
+from clients.caches import seen_campaigns
 from clients.serializers import (
     ClientAdSerializer,
+    build_client_ad,
     MLScoreCreateSerializer,
     ClientSerializer,
     AdClickSerializer,
 )
 from clients.models import Client, MLScore, AdClick, AdImpression
-from core.models import CurrentDate
+from clients.ranking import get_best_campaign
+from conf import settings
+from core.metrics import timed
+from core.parsers import NDJSONParser, ORJSONParser
 from core.views import BulkCreateUpdateAPIView
 
 
 class ClientMassCreateUpdateView(BulkCreateUpdateAPIView):
-    pk_field_name = "client_id"
     serializer_class = ClientSerializer
 
 
@@ -38,139 +49,73 @@ class ClientRetrieveView(RetrieveAPIView):
 class AdRetrieveView(RetrieveAPIView):
     serializer_class = ClientAdSerializer
 
-    def get_queryset(self):
+    @cached_property
+    def ad_client(self):
         client_id = self.request.query_params.get("client_id")
-        client = get_object_or_404(Client, pk=client_id)
-        today_date = CurrentDate.get_today()
+        return get_object_or_404(Client, pk=client_id)
+
+    def get_queryset(self):
+        campaign_ids = targeting_index.get_campaign_ids(self.ad_client)
+        if not campaign_ids:
+            raise Http404
 
         campaigns = Campaign.objects.filter(
-            Q(start_date__lte=today_date) & Q(end_date__gte=today_date),
-            Q(targeting__age_from__lte=client.age)
-            | Q(targeting__age_from__isnull=True),
-            Q(targeting__age_to__gte=client.age) | Q(targeting__age_to__isnull=True),
-            Q(targeting__location=client.location)
-            | Q(targeting__location__isnull=True),
-            Q(targeting__gender=client.gender)
-            | Q(targeting__gender__isnull=True)
-            | Q(targeting__gender="ALL"),
+            Q(pk__in=campaign_ids),
+            Q(moderation_status="APPROVED"),
+            Q(events_archived=False),
             Q(impressions_count__lte=F("impressions_limit") * 1.049),
             Q(clicks_count__lte=F("clicks_limit") * 1.049),
         )
 
-        if not campaigns.exists():
-            raise Http404
-
         return campaigns
 
     def get_object(self):
-        client_id = self.request.query_params.get("client_id")
-        client = get_object_or_404(Client, pk=client_id)
+        client = self.ad_client
 
-        ad_clicks = AdClick.objects.filter(client=client)
         ml_scores = MLScore.objects.filter(client=client)
-        ad_impressions = AdImpression.objects.filter(client=client)
+        advertiser_ml_score = ml_scores.filter(advertiser=OuterRef("advertiser"))
 
         campaigns = self.get_queryset().annotate(
-            impressed=Exists(ad_impressions.filter(campaign=OuterRef("pk"))),
-            clicked=Exists(ad_clicks.filter(campaign=OuterRef("pk"))),
             ml_score=Coalesce(
-                ml_scores.filter(advertiser=OuterRef("advertiser")).values("score")[:1],
+                advertiser_ml_score.values("score")[:1],
                 Value(0),
                 output_field=FloatField(),
             ),
         )
 
-        campaigns = campaigns.annotate(
-            profit=Coalesce(
-                F("cost_per_click")
-                * Case(
-                    When(clicked=True, then=Value(0)),
-                    default=Value(1),
-                    output_field=FloatField(),
-                )
-                + F("cost_per_impression")
-                * Case(
-                    When(impressed=True, then=Value(0)),
-                    default=Value(1),
-                    output_field=FloatField(),
-                ),
-                Value(0),
-                output_field=FloatField(),
-            ),
-            completion=Coalesce(
-                Value(0.5)
-                * (
-                    Value(1)
-                    - Case(
-                        When(clicks_limit=0, then=Value(0)),
-                        default=F("clicks_count") * (1.0001 / F("clicks_limit")),
-                        output_field=FloatField(),
-                    )
-                )
-                * Case(
-                    When(clicked=True, then=Value(0)),
-                    default=Value(1),
-                    output_field=FloatField(),
-                )
-                + Value(0.5)
-                * (
-                    Value(1)
-                    - Case(
-                        When(impressions_limit=0, then=Value(0)),
-                        default=F("impressions_count")
-                        * (1.0001 / F("impressions_limit")),
-                        output_field=FloatField(),
-                    )
-                )
-                * Case(
-                    When(impressed=True, then=Value(0)),
-                    default=Value(1),
-                    output_field=FloatField(),
-                ),
-                Value(0),
-                output_field=FloatField(),
-            ),
-        )
-
-        max_values = campaigns.aggregate(
-            max_profit=Coalesce(Max("profit"), Value(0), output_field=FloatField()),
-            max_ml_score=Coalesce(Max("ml_score"), Value(0), output_field=FloatField()),
-            max_completion=Coalesce(
-                Max("completion"), Value(0), output_field=FloatField()
-            ),
-        )
+        if seen_campaigns.enabled:
+            campaigns = list(campaigns.order_by("created_at"))
+            seen_campaigns.retain(targeting_index.key, targeting_index.targets)
+            seen = seen_campaigns.get(client.pk)
+            for campaign in campaigns:
+                campaign.impressed = seen.is_impressed(campaign.pk)
+                campaign.clicked = seen.is_clicked(campaign.pk)
+        else:
+            ad_clicks = AdClick.objects.filter(client=client)
+            ad_impressions = AdImpression.objects.filter(client=client)
+            campaigns = list(
+                campaigns.annotate(
+                    impressed=Exists(ad_impressions.filter(campaign=OuterRef("pk"))),
+                    clicked=Exists(ad_clicks.filter(campaign=OuterRef("pk"))),
+                ).order_by("created_at")
+            )
 
-        campaigns = campaigns.annotate(
-            norm_profit=Case(
-                When(profit=0, then=Value(0)),
-                default=F("profit") / Value(max_values["max_profit"]),
-                output_field=FloatField(),
-            ),
-            norm_ml_score=Case(
-                When(ml_score=0, then=Value(0)),
-                default=F("ml_score") / Value(max_values["max_ml_score"]),
-                output_field=FloatField(),
-            ),
-            norm_completion=Case(
-                When(completion=0, then=Value(0)),
-                default=F("completion") / (1.001 * Value(max_values["max_completion"])),
-                output_field=FloatField(),
-            ),
-            final_score=(F("norm_ml_score") * 0.1)
-            + (F("norm_completion") * 0.2)
-            + (F("norm_profit") * 0.7),
-        ).order_by("-final_score")
+        if settings.BUFFER_AD_IMPRESSIONS:
+            for campaign in campaigns:
+                campaign.impressed = campaign.impressed or impression_buffer.contains(
+                    campaign.pk, client.pk
+                )
 
-        best_ad = campaigns.first()
+        best_ad = get_best_campaign(campaigns)
         if not best_ad:
-            raise ValidationError()
+            raise Http404
 
         if not best_ad.impressed:
-            AdImpression.objects.create(
-                campaign=best_ad, client=client, cost=best_ad.cost_per_impression
-            )
-            best_ad.impressions_count += 1
-            best_ad.save()
+            if settings.BUFFER_AD_IMPRESSIONS:
+                impression_buffer.add(best_ad, client)
+            else:
+                AdImpression.record(best_ad, client)
+            seen_campaigns.add_impression(best_ad.pk, client.pk)
 
         return best_ad
 
@@ -187,7 +132,9 @@ class AdRetrieveView(RetrieveAPIView):
         responses={200: None},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        best_ad = self.get_object()
+        with timed("serializer"):
+            return Response(build_client_ad(best_ad, request))
 
 
 class AdClickView(GenericAPIView):
@@ -196,20 +143,28 @@ class AdClickView(GenericAPIView):
     lookup_url_kwarg = "adId"
 
     def post(self, request, *args, **kwargs):
-        ad = self.get_object()
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        client = get_object_or_404(Client, pk=serializer.validated_data["client_id"])
-        if AdImpression.objects.filter(client=client, campaign=ad).exists():
-            if not AdClick.objects.filter(client=client, campaign=ad).exists():
-                AdClick.objects.create(
-                    client=client, campaign=ad, cost=ad.cost_per_click
-                )
-                ad.clicks_count += 1
-                ad.save()
-        else:
+        if not serializer.is_valid():
+            self.get_object()
+            serializer.is_valid(raise_exception=True)
+
+        ad_id = self.kwargs["adId"]
+        client_id = serializer.validated_data["client_id"]
+        if settings.BUFFER_AD_IMPRESSIONS and impression_buffer.contains(
+            ad_id, client_id
+        ):
+            impression_buffer.flush()
+
+        ad_exists, client_exists, impressed = AdClick.record_if_impressed(
+            ad_id, client_id
+        )
+        if not ad_exists or not client_exists:
+            raise Http404
+        if not impressed:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
+        seen_campaigns.add_click(ad_id, client_id)
+
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -226,3 +181,63 @@ class MlScoreCreateUpdateView(CreateAPIView):
         self.perform_create(serializer)
 
         return Response(status=status.HTTP_201_CREATED)
+
+
+class MlScoreBulkCreateUpdateView(GenericAPIView):
+    serializer_class = MLScoreCreateSerializer
+    parser_classes = [ORJSONParser, NDJSONParser]
+    batch_size = 5000
+
+    def post(self, request, *args, **kwargs):
+        data = request.data
+        if not isinstance(data, (list, GeneratorType)):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        saved = 0
+        items = iter(data)
+        while True:
+            try:
+                chunk = list(islice(items, self.batch_size))
+            except ParseError as exc:
+                return Response(
+                    {"detail": exc.detail, "saved": saved},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if not chunk:
+                break
+
+            serializer = self.get_serializer(data=chunk, many=True)
+            if not serializer.is_valid():
+                errors = {
+                    saved + index: item_errors
+                    for index, item_errors in enumerate(serializer.errors)
+                    if item_errors
+                }
+                return Response(
+                    {"errors": errors, "saved": saved},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            ml_scores = [MLScore(**item) for item in serializer.validated_data]
+            with transaction.atomic():
+                missing = {
+                    "client_id": self.get_missing_ids(
+                        Client, {ml_score.client_id for ml_score in ml_scores}
+                    ),
+                    "advertiser_id": self.get_missing_ids(
+                        Advertiser, {ml_score.advertiser_id for ml_score in ml_scores}
+                    ),
+                }
+                if missing["client_id"] or missing["advertiser_id"]:
+                    return Response(
+                        {**missing, "saved": saved}, status=status.HTTP_404_NOT_FOUND
+                    )
+                MLScore.upsert_many(ml_scores)
+
+            saved += len(ml_scores)
+
+        return Response({"saved": saved}, status=status.HTTP_201_CREATED)
+
+    def get_missing_ids(self, model, ids):
+        existing_ids = model.objects.filter(pk__in=ids).values_list("pk", flat=True)
+        return sorted(ids - set(existing_ids), key=str)
@@ -2,7 +2,6 @@ import os
 from datetime import timedelta
 from pathlib import Path
 from dotenv import load_dotenv
-from gigachat import GigaChat
 
 
 def load_bool(name, default):
@@ -10,6 +9,11 @@ def load_bool(name, default):
     return env_value in ("true", "yes", "1", "y", "t")
 
 
+def load_int(name, default):
+    env_value = os.getenv(name)
+    return int(env_value) if env_value else default
+
+
 load_dotenv()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -25,17 +29,48 @@ ALLOWED_HOSTS = ["*"]
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "core.paginations.CustomPageNumberPagination",
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "PAGE_SIZE": 10,
 }
 
-GIGACHAT_MODEL = GigaChat(
-    credentials=os.getenv("GIGACHAT_TOKEN"),
-    scope=os.getenv("GIGACHAT_SCOPE"),
-    model="GigaChat",
-    ca_bundle_file=str(BASE_DIR / "../certs/min_cifra_root_ca.cer"),
-)
+GIGACHAT_TOKEN = os.getenv("GIGACHAT_TOKEN")
+GIGACHAT_SCOPE = os.getenv("GIGACHAT_SCOPE")
+GIGACHAT_MODEL = "GigaChat"
+GIGACHAT_CA_BUNDLE_FILE = str(BASE_DIR / "../certs/min_cifra_root_ca.cer")
 
 MODERATE_AD_TEXT = load_bool("MODERATE_AD_TEXT", False)
+ASYNC_MODERATION = load_bool("ASYNC_MODERATION", False)
+MODERATION_WORKER_CONCURRENCY = load_int("MODERATION_WORKER_CONCURRENCY", 4)
+MODERATION_POLL_INTERVAL_MS = load_int("MODERATION_POLL_INTERVAL_MS", 1000)
+MODERATION_TASK_TIMEOUT_SECONDS = load_int("MODERATION_TASK_TIMEOUT_SECONDS", 300)
+CAMPAIGN_BULK_LLM_CONCURRENCY = max(1, load_int("CAMPAIGN_BULK_LLM_CONCURRENCY", 8))
+LLM_CACHE_TTL_SECONDS = load_int("LLM_CACHE_TTL_SECONDS", 7 * 24 * 60 * 60)
+LLM_CACHE_MAX_SIZE = load_int("LLM_CACHE_MAX_SIZE", 10000)
+
+BUFFER_AD_IMPRESSIONS = load_bool("BUFFER_AD_IMPRESSIONS", False)
+IMPRESSION_BUFFER_FLUSH_INTERVAL_MS = load_int(
+    "IMPRESSION_BUFFER_FLUSH_INTERVAL_MS", 200
+)
+IMPRESSION_BUFFER_MAX_SIZE = load_int("IMPRESSION_BUFFER_MAX_SIZE", 500)
+IMPRESSION_BUFFER_MAX_FLUSH_ATTEMPTS = load_int(
+    "IMPRESSION_BUFFER_MAX_FLUSH_ATTEMPTS", 10
+)
+SEEN_CAMPAIGNS_CACHE_SIZE = load_int("SEEN_CAMPAIGNS_CACHE_SIZE", 0)
+SEEN_CAMPAIGNS_CACHE_TTL_SECONDS = load_int("SEEN_CAMPAIGNS_CACHE_TTL_SECONDS", 30)
+
+METRICS_ENABLED = load_bool("METRICS_ENABLED", False)
+SERVER_TIMING_HEADER = load_bool("SERVER_TIMING_HEADER", False)
+QUERY_INSPECTOR_ENABLED = load_bool("QUERY_INSPECTOR_ENABLED", False)
+QUERY_INSPECTOR_MAX_REPEATS = load_int("QUERY_INSPECTOR_MAX_REPEATS", 3)
+QUERY_INSPECTOR_SLOW_MS = load_int("QUERY_INSPECTOR_SLOW_MS", 100)
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Project API",
@@ -51,6 +86,8 @@ SPECTACULAR_SETTINGS = {
 }
 
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.QueryInspectorMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -58,6 +95,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.CacheVersionMiddleware",
 ]
 
 INSTALLED_APPS = [
@@ -107,5 +145,17 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": "5432",
+        "CONN_MAX_AGE": load_int("DB_CONN_MAX_AGE", 60),
+        "CONN_HEALTH_CHECKS": load_bool("DB_CONN_HEALTH_CHECKS", True),
     }
 }
+
+if load_bool("DB_POOL", False):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": load_int("DB_POOL_MIN_SIZE", 2),
+            "max_size": load_int("DB_POOL_MAX_SIZE", 10),
+            "timeout": load_int("DB_POOL_TIMEOUT", 10),
+        }
+    }
@@ -7,8 +7,13 @@ from drf_spectacular.views import (
     SpectacularRedocView,
 )
 
-from clients.views import MlScoreCreateUpdateView, AdRetrieveView, AdClickView
-from core.views import DateSetView
+from clients.views import (
+    MlScoreCreateUpdateView,
+    MlScoreBulkCreateUpdateView,
+    AdRetrieveView,
+    AdClickView,
+)
+from core.views import DateSetView, metrics_view
 from conf import settings
 
 urlpatterns = [
@@ -17,9 +22,15 @@ urlpatterns = [
     path("clients/", include("clients.urls")),
     path("stats", include("stats.urls")),
     path("ml-scores", MlScoreCreateUpdateView.as_view(), name="ml-scores"),
+    path(
+        "ml-scores/bulk",
+        MlScoreBulkCreateUpdateView.as_view(),
+        name="ml-scores-bulk",
+    ),
     path("time/advance", DateSetView.as_view(), name="time-advance"),
     path("ads", AdRetrieveView.as_view(), name="ads"),
     path("ads/<uuid:adId>/click", AdClickView.as_view(), name="ads-click"),
+    path("metrics", metrics_view, name="metrics"),
     path("schema", SpectacularAPIView.as_view(), name="schema"),
     path(
         "swagger",
@@ -0,0 +1,102 @@
+import time
+import uuid
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from rest_framework import serializers
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from advertisers.models import Campaign
+from clients.models import Client
+from clients.serializers import ClientAdSerializer, ClientSerializer, build_client_ad
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from stats.views import build_stats
+
+
+class RebuildingClientSerializer(ClientSerializer):
+    def to_representation(self, instance):
+        representation = serializers.ModelSerializer.to_representation(self, instance)
+        return {
+            key: value
+            for key, value in representation.items()
+            if value is not None and value != []
+        }
+
+
+class Command(BaseCommand):
+    help = "Compare serialization, rendering and parsing speed on large payloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def measure(self, function):
+        timings = []
+        for _ in range(self.repeat):
+            started_at = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - started_at)
+        return min(timings) * 1000
+
+    def compare(self, name, baseline, optimized):
+        baseline_ms = self.measure(baseline)
+        optimized_ms = self.measure(optimized)
+        self.stdout.write(
+            f"{name:<32}{baseline_ms:>10.1f} ms{optimized_ms:>10.1f} ms"
+            f"{baseline_ms / optimized_ms:>8.1f}x"
+        )
+
+    def handle(self, *args, **options):
+        self.repeat = options["repeat"]
+        clients = [
+            Client(
+                id=uuid.uuid4(),
+                login=f"client_{index}",
+                age=index % 100,
+                location="Moscow",
+                gender="MALE",
+            )
+            for index in range(options["items"])
+        ]
+        campaigns = [
+            Campaign(
+                id=uuid.uuid4(),
+                advertiser_id=uuid.uuid4(),
+                ad_title=f"title {index}",
+                ad_text="text",
+            )
+            for index in range(options["items"])
+        ]
+        payloads = {
+            "/clients/bulk": ClientSerializer(clients, many=True).data,
+            "/stats daily": [
+                {**build_stats(index, index // 10, index * 2, index), "date": index}
+                for index in range(options["items"])
+            ],
+        }
+
+        self.stdout.write(f"{'':<32}{'baseline':>13}{'optimized':>13}{'speedup':>9}")
+        self.compare(
+            "serialize /clients/bulk",
+            lambda: RebuildingClientSerializer(clients, many=True).data,
+            lambda: ClientSerializer(clients, many=True).data,
+        )
+        self.compare(
+            "serialize /ads",
+            lambda: [ClientAdSerializer(campaign).data for campaign in campaigns],
+            lambda: [build_client_ad(campaign) for campaign in campaigns],
+        )
+        for name, payload in payloads.items():
+            body = JSONRenderer().render(payload)
+            self.compare(
+                f"render {name}",
+                lambda: JSONRenderer().render(payload),
+                lambda: ORJSONRenderer().render(payload),
+            )
+            self.compare(
+                f"parse {name}",
+                lambda: JSONParser().parse(BytesIO(body)),
+                lambda: ORJSONParser().parse(BytesIO(body)),
+            )
@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connection
+
+request_timings = ContextVar("request_timings", default=None)
+active_phases = ContextVar("active_phases", default=frozenset())
+
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+PHASES = ["db", "llm", "serializer"]
+
+
+class RequestTimings:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.query_count = 0
+
+    def add(self, phase, duration):
+        with self.lock:
+            self.durations[phase] += duration
+
+    def time_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            with self.lock:
+                self.durations["db"] += duration
+                self.query_count += 1
+
+    def get_server_timing(self, total):
+        metrics = [f"total;dur={total * 1000:.3f}"]
+        for phase, duration in self.durations.items():
+            description = f';desc="{self.query_count} queries"' if phase == "db" else ""
+            metrics.append(f"{phase};dur={duration * 1000:.3f}{description}")
+        return ", ".join(metrics)
+
+
+@contextmanager
+def timed(phase):
+    timings = request_timings.get()
+    phases = active_phases.get()
+    if timings is None or phase in phases:
+        yield
+        return
+
+    token = active_phases.set(phases | {phase})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+        active_phases.reset(token)
+
+
+@contextmanager
+def track_queries(db_connection=connection):
+    timings = request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    with db_connection.execute_wrapper(timings.time_query):
+        yield
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels):
+    return ",".join(f'{name}="{escape_label(value)}"' for name, value in labels)
+
+
+class Counter:
+    type_name = "counter"
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.values = defaultdict(int)
+
+    def observe(self, labels, value=1):
+        self.values[labels] += value
+
+    def render(self):
+        for labels, value in sorted(self.values.items()):
+            yield f"{self.name}{{{format_labels(labels)}}} {value}"
+
+
+class Histogram:
+    type_name = "histogram"
+
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.values = {}
+
+    def observe(self, labels, value):
+        if labels not in self.values:
+            self.values[labels] = [[0] * len(self.buckets), 0, 0]
+
+        bucket_counts, _, _ = observation = self.values[labels]
+        for index, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                bucket_counts[index] += 1
+        observation[1] += value
+        observation[2] += 1
+
+    def render(self):
+        for labels, (bucket_counts, total, count) in sorted(self.values.items()):
+            for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                bucket_labels = format_labels(labels + (("le", bucket),))
+                yield f"{self.name}_bucket{{{bucket_labels}}} {bucket_count}"
+
+            bucket_labels = format_labels(labels + (("le", "+Inf"),))
+            yield f"{self.name}_bucket{{{bucket_labels}}} {count}"
+            yield f"{self.name}_sum{{{format_labels(labels)}}} {total}"
+            yield f"{self.name}_count{{{format_labels(labels)}}} {count}"
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = Counter("api_requests_total", "Number of handled requests")
+        self.duration = Histogram(
+            "api_request_duration_seconds",
+            "Request wall time in seconds",
+            DURATION_BUCKETS,
+        )
+        self.phase_duration = Histogram(
+            "api_request_phase_duration_seconds",
+            "Time spent in database queries, LLM calls and serializers per request",
+            DURATION_BUCKETS,
+        )
+        self.db_queries = Histogram(
+            "api_request_db_queries",
+            "Number of database queries per request",
+            QUERY_COUNT_BUCKETS,
+        )
+
+    def observe(self, view, method, status_code, total, timings):
+        labels = (("view", view), ("method", method))
+        with self.lock:
+            self.requests.observe(labels + (("status", status_code),))
+            self.duration.observe(labels, total)
+            self.db_queries.observe(labels, timings.query_count)
+            for phase, duration in timings.durations.items():
+                self.phase_duration.observe(labels + (("phase", phase),), duration)
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for metric in [
+                self.requests,
+                self.duration,
+                self.phase_duration,
+                self.db_queries,
+            ]:
+                lines.append(f"# HELP {metric.name} {metric.description}")
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,86 @@
+import logging
+import time
+
+from conf import settings
+from core.metrics import (
+    RequestTimings,
+    request_metrics,
+    request_timings,
+    track_queries,
+)
+from core.models import request_cache_versions
+from core.queries import QueryInspector
+
+logger = logging.getLogger(__name__)
+
+
+class CacheVersionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = request_cache_versions.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            request_cache_versions.reset(token)
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED and not settings.SERVER_TIMING_HEADER:
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        started = time.perf_counter()
+        try:
+            with track_queries():
+                response = self.get_response(request)
+        finally:
+            request_timings.reset(token)
+        total = time.perf_counter() - started
+
+        if settings.METRICS_ENABLED:
+            resolver_match = request.resolver_match
+            request_metrics.observe(
+                resolver_match.view_name if resolver_match else "unmatched",
+                request.method,
+                response.status_code,
+                total,
+                timings,
+            )
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = timings.get_server_timing(total)
+
+        return response
+
+
+class QueryInspectorMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            return self.get_response(request)
+
+        with QueryInspector() as inspector:
+            response = self.get_response(request)
+
+        problems = inspector.get_problems(
+            settings.QUERY_INSPECTOR_MAX_REPEATS, settings.QUERY_INSPECTOR_SLOW_MS
+        )
+        if problems:
+            resolver_match = request.resolver_match
+            logger.warning(
+                "%s %s made %s queries:\n%s",
+                request.method,
+                resolver_match.view_name if resolver_match else request.path,
+                len(inspector.queries),
+                "\n".join(problems),
+            )
+
+        return response
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:39
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheVersion",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="Название кэша"
+                    ),
+                ),
+                (
+                    "version",
+                    models.UUIDField(default=uuid.uuid4, verbose_name="Версия"),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -1,7 +1,10 @@
 import uuid
+from contextvars import ContextVar
 
 from django.db import models
 
+request_cache_versions = ContextVar("request_cache_versions", default=None)
+
 
 class UUIDModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -11,10 +14,42 @@ class UUIDModel(models.Model):
 
 
 class CurrentDate(UUIDModel):
+    version_name = "current_date"
+    cached_today = (None, None)
+
     current_date = models.IntegerField()
 
     @classmethod
     def get_today(cls):
-        dates = cls.objects.all()
-        today = dates.first().current_date if dates.exists() else 0
+        version = CacheVersion.get_version(cls.version_name)
+        cached_version, today = cls.cached_today
+        if today is None or cached_version != version:
+            today = cls.objects.values_list("current_date", flat=True).first() or 0
+            cls.cached_today = (version, today)
         return today
+
+
+class CacheVersion(UUIDModel):
+    name = models.CharField("Название кэша", max_length=100, unique=True)
+    version = models.UUIDField("Версия", default=uuid.uuid4)
+
+    @classmethod
+    def get_version(cls, name):
+        snapshot = request_cache_versions.get()
+        if snapshot is None:
+            return (
+                cls.objects.filter(name=name).values_list("version", flat=True).first()
+            )
+
+        if "versions" not in snapshot:
+            snapshot["versions"] = dict(cls.objects.values_list("name", "version"))
+        return snapshot["versions"].get(name)
+
+    @classmethod
+    def bump(cls, name):
+        version = uuid.uuid4()
+        cls.objects.update_or_create(name=name, defaults={"version": version})
+
+        snapshot = request_cache_versions.get()
+        if snapshot is not None and "versions" in snapshot:
+            snapshot["versions"][name] = version
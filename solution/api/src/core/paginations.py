@@ -1,5 +1,123 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size_query_param = "size"
+
+
+class KeysetPagination(BasePagination):
+    ordering = ["created_at", "id"]
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    page_query_param = "page"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor is not None:
+            try:
+                queryset = queryset.filter(
+                    self.get_keyset_filter(self.decode_cursor(cursor))
+                )
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound("Invalid cursor.")
+            offset = 0
+        else:
+            offset = (self.get_page_number(request) - 1) * page_size
+
+        page = list(queryset[offset : offset + page_size + 1])
+        if not page and offset:
+            raise NotFound("Invalid page.")
+
+        self.has_next = len(page) > page_size
+        self.page = page[:page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        headers = {}
+        next_link = self.get_next_link()
+        if next_link is not None:
+            headers["Link"] = f'<{next_link}>; rel="next"'
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_page_number(self, request):
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound("Invalid page.")
+        if page_number < 1:
+            raise NotFound("Invalid page.")
+        return page_number
+
+    def get_keyset_filter(self, values):
+        conditions = []
+        for index, field_name in enumerate(self.ordering):
+            equal_fields = dict(zip(self.ordering[:index], values[:index]))
+            conditions.append(Q(**equal_fields, **{f"{field_name}__gt": values[index]}))
+        return reduce(or_, conditions)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        values = [str(getattr(last, field_name)) for field_name in self.ordering]
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values)
+        )
+        return remove_query_param(url, self.page_query_param)
+
+    def encode_cursor(self, values):
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            raise NotFound("Invalid cursor.")
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound("Invalid cursor.")
+        return values
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": {"type": schema_type},
+            }
+            for name, description, schema_type in [
+                (self.cursor_query_param, "Cursor from the Link header", "string"),
+                (self.page_query_param, "Page number", "integer"),
+                (self.page_size_query_param, "Page size", "integer"),
+            ]
+        ]
@@ -0,0 +1,83 @@
+import re
+import time
+from collections import Counter
+
+from django.db import connection
+
+STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+SAVEPOINT_PATTERN = re.compile(r'"s\d+_x\d+"')
+PLACEHOLDER_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+ROWS_PATTERN = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TRANSACTION_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def normalize_sql(sql):
+    shape = STRING_PATTERN.sub("?", sql)
+    shape = SAVEPOINT_PATTERN.sub("?", shape)
+    shape = NUMBER_PATTERN.sub("?", shape)
+    shape = shape.replace("%s", "?")
+    shape = PLACEHOLDER_LIST_PATTERN.sub("(...)", shape)
+    shape = ROWS_PATTERN.sub("(...)", shape)
+    return WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+class QueryInspector:
+    def __init__(self, db_connection=connection):
+        self.connection = db_connection
+        self.queries = []
+        self.wrapper = None
+
+    def __enter__(self):
+        self.wrapper = self.connection.execute_wrapper(self.capture)
+        self.wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wrapper.__exit__(*exc_info)
+
+    def capture(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "sql": sql,
+                    "shape": normalize_sql(sql),
+                    "time": time.perf_counter() - started,
+                }
+            )
+
+    def get_shapes(self):
+        return Counter(query["shape"] for query in self.queries)
+
+    def get_repeated(self, max_repeats):
+        return {
+            shape: count
+            for shape, count in self.get_shapes().items()
+            if count > max_repeats and not shape.startswith(TRANSACTION_STATEMENTS)
+        }
+
+    def get_slow(self, slow_ms):
+        return [query for query in self.queries if query["time"] * 1000 > slow_ms]
+
+    def get_problems(self, max_repeats=None, slow_ms=None):
+        problems = []
+        if max_repeats is not None:
+            problems.extend(
+                f"{count} x possible N+1: {shape}"
+                for shape, count in self.get_repeated(max_repeats).items()
+            )
+        if slow_ms is not None:
+            problems.extend(
+                f"slow query {query['time'] * 1000:.1f} ms: {query['shape']}"
+                for query in self.get_slow(slow_ms)
+            )
+        return problems
+
+    def get_report(self):
+        return "\n".join(
+            f"{count} x {shape}" for shape, count in self.get_shapes().most_common()
+        )
@@ -1,15 +1,31 @@
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+from core.metrics import timed
 from core.models import CurrentDate
 
 
 class NotNullModelSerializerMixin:
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        return {
-            key: value
-            for key, value in representation.items()
-            if value is not None and value != []
-        }
+        with timed("serializer"):
+            representation = {}
+            for field in self._readable_fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+
+                if attribute is None or (
+                    isinstance(attribute, PKOnlyObject) and attribute.pk is None
+                ):
+                    continue
+
+                value = field.to_representation(attribute)
+                if value is not None and value != []:
+                    representation[field.field_name] = value
+
+            return representation
 
 
 class CurrentDateSerializer(serializers.ModelSerializer):
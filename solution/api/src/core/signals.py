@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.models import CacheVersion, CurrentDate
+
+
+@receiver([post_save, post_delete], sender=CurrentDate)
+def invalidate_current_date(sender, **kwargs):
+    CacheVersion.bump(CurrentDate.version_name)
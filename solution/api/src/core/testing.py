@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.queries import QueryInspector
+
+
+class QueryCountTestMixin:
+    def assertQueriesDoNotGrow(self, make_request, add_objects):
+        with CaptureQueriesContext(connection) as initial_queries:
+            make_request()
+        add_objects()
+        with CaptureQueriesContext(connection) as queries:
+            make_request()
+
+        self.assertEqual(
+            len(queries),
+            len(initial_queries),
+            "Queries grew with the number of objects:\n"
+            + "\n".join(query["sql"] for query in queries),
+        )
+        return len(queries)
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries, max_repeats=1, slow_ms=None):
+        with QueryInspector() as inspector:
+            yield inspector
+
+        self.assertLessEqual(
+            len(inspector.queries),
+            max_queries,
+            f"Query budget exceeded:\n{inspector.get_report()}",
+        )
+        problems = inspector.get_problems(max_repeats, slow_ms)
+        self.assertFalse(
+            problems,
+            "\n".join(problems) + f"\nAll queries:\n{inspector.get_report()}",
+        )
@@ -0,0 +1,65 @@
+import json
+import uuid
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from clients.models import Client
+from clients.serializers import ClientSerializer
+from core import parsers, renderers
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    data = {
+        "id": uuid.uuid4(),
+        "price": Decimal("1.50"),
+        "created_at": timezone.now(),
+        "errors": {0: ["invalid"], 5: ["required"]},
+        "text": "Привет\u2028мир",
+        "items": [1, 2.5, None, True],
+    }
+
+    def test_matches_json_renderer(self):
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(self.data)),
+            json.loads(JSONRenderer().render(self.data)),
+        )
+        self.assertIn(b"\\u2028", ORJSONRenderer().render(self.data))
+
+    def test_indent_and_missing_orjson_use_json_renderer(self):
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, "application/json; indent=4"),
+            JSONRenderer().render(self.data, "application/json; indent=4"),
+        )
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(
+                ORJSONRenderer().render(self.data), JSONRenderer().render(self.data)
+            )
+
+
+class ORJSONParserTest(SimpleTestCase):
+    def test_parse(self):
+        for orjson in [parsers.orjson, None]:
+            with mock.patch.object(parsers, "orjson", orjson):
+                self.assertEqual(
+                    ORJSONParser().parse(BytesIO('[{"a": "б"}]'.encode())),
+                    [{"a": "б"}],
+                )
+                with self.assertRaises(ParseError):
+                    ORJSONParser().parse(BytesIO(b"[{"))
+
+
+class NotNullModelSerializerMixinTest(SimpleTestCase):
+    def test_strips_only_null_values(self):
+        client = Client(id=uuid.uuid4(), login="", age=0, location=None, gender=None)
+        self.assertEqual(
+            ClientSerializer(client).data,
+            {"login": "", "age": 0, "client_id": str(client.id)},
+        )
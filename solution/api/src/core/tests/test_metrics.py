@@ -0,0 +1,150 @@
+import threading
+from contextvars import copy_context
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APITestCase
+
+from conf import settings
+from core.metrics import (
+    RequestMetrics,
+    RequestTimings,
+    request_timings,
+    timed,
+    track_queries,
+)
+
+
+class RequestMetricsTest(SimpleTestCase):
+    def test_render_histograms(self):
+        metrics = RequestMetrics()
+        timings = RequestTimings()
+        timings.query_count = 3
+        timings.add("db", 0.02)
+
+        metrics.observe("ads", "GET", 200, 0.03, timings)
+        metrics.observe("ads", "GET", 404, 2, RequestTimings())
+        lines = metrics.render().splitlines()
+
+        self.assertIn("# TYPE api_request_duration_seconds histogram", lines)
+        self.assertIn(
+            'api_requests_total{view="ads",method="GET",status="200"} 1', lines
+        )
+        self.assertIn(
+            'api_request_duration_seconds_bucket{view="ads",method="GET",le="0.025"} 0',
+            lines,
+        )
+        self.assertIn(
+            'api_request_duration_seconds_bucket{view="ads",method="GET",le="0.05"} 1',
+            lines,
+        )
+        self.assertIn(
+            'api_request_duration_seconds_bucket{view="ads",method="GET",le="+Inf"} 2',
+            lines,
+        )
+        self.assertIn(
+            'api_request_duration_seconds_count{view="ads",method="GET"} 2', lines
+        )
+        self.assertIn(
+            'api_request_db_queries_bucket{view="ads",method="GET",le="3"} 2', lines
+        )
+        self.assertIn(
+            'api_request_phase_duration_seconds_sum{view="ads",method="GET",phase="db"} 0.02',
+            lines,
+        )
+
+    def test_nested_phase_is_timed_once(self):
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            with mock.patch("core.metrics.time.perf_counter", side_effect=[1, 6]):
+                with timed("serializer"):
+                    with timed("serializer"):
+                        pass
+        finally:
+            request_timings.reset(token)
+
+        self.assertEqual(timings.durations["serializer"], 5)
+
+    def test_timed_without_request(self):
+        with timed("llm"):
+            pass
+
+
+class TrackQueriesTest(TestCase):
+    def run_query(self, context):
+        try:
+            context.run(self.track_query)
+        finally:
+            connection.close()
+
+    def track_query(self):
+        with track_queries():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+    def test_queries_from_other_threads_are_counted(self):
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            threads = [
+                threading.Thread(target=self.run_query, args=[copy_context()])
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            request_timings.reset(token)
+
+        self.assertEqual(timings.query_count, 4)
+
+    def test_without_request(self):
+        self.track_query()
+
+
+class MetricsMiddlewareTest(APITestCase):
+    def setUp(self):
+        self.metrics = RequestMetrics()
+        patchers = [
+            mock.patch("core.middleware.request_metrics", self.metrics),
+            mock.patch("core.views.request_metrics", self.metrics),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def advance_time(self):
+        return self.client.post("/time/advance", {"current_date": 1}, format="json")
+
+    @mock.patch.multiple(settings, METRICS_ENABLED=True, SERVER_TIMING_HEADER=False)
+    def test_metrics_endpoint(self):
+        response = self.advance_time()
+        self.assertNotIn("Server-Timing", response)
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/plain; version=0.0.4")
+        lines = response.content.decode().splitlines()
+        self.assertIn(
+            'api_requests_total{view="time-advance",method="POST",status="200"} 1',
+            lines,
+        )
+        self.assertIn(
+            'api_request_db_queries_bucket{view="time-advance",method="POST",le="0"} 0',
+            lines,
+        )
+
+    @mock.patch.multiple(settings, METRICS_ENABLED=False, SERVER_TIMING_HEADER=True)
+    def test_server_timing_header(self):
+        response = self.advance_time()
+
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", '
+            r"llm;dur=[\d.]+, serializer;dur=[\d.]+$",
+        )
+        self.assertEqual(self.metrics.render().count("api_requests_total{"), 0)
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from core.models import CacheVersion, CurrentDate, request_cache_versions
+
+
+class CurrentDateCacheTest(TestCase):
+    def test_default_today(self):
+        self.assertEqual(CurrentDate.get_today(), 0)
+
+    def test_today_changes_after_time_advance(self):
+        self.assertEqual(CurrentDate.get_today(), 0)
+        for current_date in [7, 3]:
+            response = self.client.post(
+                "/time/advance",
+                {"current_date": current_date},
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(CurrentDate.get_today(), current_date)
+
+    def test_cached_today_checks_only_version(self):
+        CurrentDate.objects.create(current_date=4)
+        CurrentDate.get_today()
+        with self.assertNumQueries(1):
+            self.assertEqual(CurrentDate.get_today(), 4)
+
+    def test_request_snapshot_reads_versions_once(self):
+        CurrentDate.objects.create(current_date=4)
+        CurrentDate.get_today()
+        token = request_cache_versions.set({})
+        try:
+            with self.assertNumQueries(1):
+                for _ in range(5):
+                    self.assertEqual(CurrentDate.get_today(), 4)
+        finally:
+            request_cache_versions.reset(token)
+
+    def test_bump_changes_version(self):
+        self.assertIsNone(CacheVersion.get_version("test"))
+        CacheVersion.bump("test")
+        version = CacheVersion.get_version("test")
+        CacheVersion.bump("test")
+        self.assertNotEqual(CacheVersion.get_version("test"), version)
@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from advertisers.models import Advertiser, Campaign
+from conf import settings
+from core.queries import QueryInspector, normalize_sql
+from core.testing import QueryCountTestMixin
+
+
+class NormalizeSqlTest(TestCase):
+    def test_literals_and_placeholders_are_replaced(self):
+        self.assertEqual(
+            normalize_sql(
+                "SELECT  *  FROM t WHERE a = 'it''s'\n AND b = 12.5 LIMIT 21"
+            ),
+            "SELECT * FROM t WHERE a = ? AND b = ? LIMIT ?",
+        )
+        self.assertEqual(
+            normalize_sql('SELECT * FROM "t_p1" WHERE id IN (%s, %s,%s)'),
+            'SELECT * FROM "t_p1" WHERE id IN (...)',
+        )
+        self.assertEqual(
+            normalize_sql('SAVEPOINT "s1402_x12"'), normalize_sql('SAVEPOINT "s7_x3"')
+        )
+        self.assertEqual(
+            normalize_sql("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)"),
+            "INSERT INTO t (a, b) VALUES (...)",
+        )
+
+
+class QueryInspectorTest(QueryCountTestMixin, TestCase):
+    def setUp(self):
+        for i in range(3):
+            Advertiser.objects.create(name=f"advertiser_{i}")
+
+    def load_campaign_counts(self):
+        return [
+            Campaign.objects.filter(advertiser=advertiser).count()
+            for advertiser in Advertiser.objects.all()
+        ]
+
+    def test_detects_n_plus_one(self):
+        with QueryInspector() as inspector:
+            self.load_campaign_counts()
+
+        self.assertEqual(len(inspector.queries), 4)
+        self.assertEqual(list(inspector.get_repeated(max_repeats=2).values()), [3])
+        self.assertEqual(inspector.get_repeated(max_repeats=3), {})
+        self.assertEqual(len(inspector.get_slow(slow_ms=0)), 4)
+        self.assertIn("3 x possible N+1", inspector.get_problems(max_repeats=1)[0])
+
+    def test_savepoints_are_not_repeated_queries(self):
+        with QueryInspector() as inspector:
+            for _ in range(3):
+                with transaction.atomic():
+                    pass
+
+        self.assertEqual(len(inspector.queries), 6)
+        self.assertEqual(inspector.get_repeated(max_repeats=1), {})
+
+    def test_query_budget(self):
+        with self.assertQueryBudget(1):
+            list(Advertiser.objects.all())
+
+        with self.assertRaisesRegex(AssertionError, "Query budget exceeded"):
+            with self.assertQueryBudget(3, max_repeats=None):
+                self.load_campaign_counts()
+
+        with self.assertRaisesRegex(AssertionError, "possible N\\+1"):
+            with self.assertQueryBudget(10):
+                self.load_campaign_counts()
+
+    @mock.patch.multiple(
+        settings,
+        QUERY_INSPECTOR_ENABLED=True,
+        QUERY_INSPECTOR_MAX_REPEATS=3,
+        QUERY_INSPECTOR_SLOW_MS=-1,
+    )
+    def test_middleware_logs_problems(self):
+        with self.assertLogs("core.middleware", "WARNING") as logs:
+            self.client.get(f"/advertisers/{Advertiser.objects.first().pk}")
+
+        self.assertIn("GET advertiser-detail made 1 queries", logs.output[0])
+        self.assertIn("slow query", logs.output[0])
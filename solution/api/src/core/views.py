@@ -1,41 +1,54 @@
 from rest_framework.generics import GenericAPIView, CreateAPIView
 from rest_framework import status
 from rest_framework.response import Response
-from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import Http404, HttpResponse
 
+from conf import settings
+from core.metrics import request_metrics
 from core.serializers import CurrentDateSerializer
 
 
 class BulkCreateUpdateAPIView(GenericAPIView):
-    pk_field_name = "id"
+    batch_size = 1000
 
     def post(self, request, *args, **kwargs):
         data = request.data
-        response_data = []
-        for item in data:
-            try:
-                id = item.get(self.pk_field_name)
-            except AttributeError:
-                return Response(status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(data, list):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
 
-            try:
-                object = self.get_serializer_class().Meta.model.objects.get(pk=id)
-                serializer = self.get_serializer(object, data=item)
-            except self.get_serializer_class().Meta.model.DoesNotExist:
-                serializer = self.get_serializer(data=item)
-            except ValidationError:
+        model = self.get_serializer_class().Meta.model
+        pk_name = model._meta.pk.name
+        validated_items = {}
+        for item in data:
+            if not isinstance(item, dict):
                 return Response(status=status.HTTP_400_BAD_REQUEST)
 
-            if serializer.is_valid():
-                serializer.save()
-                if id in [item[self.pk_field_name] for item in response_data]:
-                    response_data = list(
-                        filter(lambda x: x[self.pk_field_name] != id, response_data)
-                    )
-                response_data.append(serializer.data)
-            else:
+            serializer = self.get_serializer(data=item)
+            if not serializer.is_valid():
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+            validated_data = serializer.validated_data
+            validated_items.pop(validated_data[pk_name], None)
+            validated_items[validated_data[pk_name]] = validated_data
+
+        objects = [
+            model(**validated_data) for validated_data in validated_items.values()
+        ]
+        update_fields = [
+            field.name for field in model._meta.concrete_fields if not field.primary_key
+        ]
+
+        with transaction.atomic():
+            model.objects.bulk_create(
+                objects,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=[pk_name],
+                update_fields=update_fields,
+            )
+
+        response_data = self.get_serializer(objects, many=True).data
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
@@ -46,3 +59,12 @@ class DateSetView(CreateAPIView):
         response = super().post(request, *args, **kwargs)
         response.status_code = 200
         return response
+
+
+def metrics_view(request):
+    if not settings.METRICS_ENABLED:
+        raise Http404
+
+    return HttpResponse(
+        request_metrics.render(), content_type="text/plain; version=0.0.4"
+    )
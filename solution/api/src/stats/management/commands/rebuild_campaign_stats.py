@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from clients.models import (
+    AdClick,
+    AdImpression,
+    AdClickArchive,
+    AdImpressionArchive,
+)
+from stats.models import CampaignDailyStats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the campaign daily stats rollup from impressions and clicks"
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        daily_stats = {}
+        for model, count_field, spent_field in [
+            (AdImpression, "impressions", "spent_impressions"),
+            (AdImpressionArchive, "impressions", "spent_impressions"),
+            (AdClick, "clicks", "spent_clicks"),
+            (AdClickArchive, "clicks", "spent_clicks"),
+        ]:
+            totals = model.objects.values("campaign", "created_at").annotate(
+                count=Count("pk"), spent=Sum("cost")
+            )
+            for total in totals:
+                key = (total["campaign"], total["created_at"])
+                if key not in daily_stats:
+                    daily_stats[key] = CampaignDailyStats(
+                        campaign_id=total["campaign"], date=total["created_at"]
+                    )
+                stats = daily_stats[key]
+                setattr(
+                    stats, count_field, getattr(stats, count_field) + total["count"]
+                )
+                setattr(
+                    stats, spent_field, getattr(stats, spent_field) + total["spent"]
+                )
+
+        CampaignDailyStats.objects.all().delete()
+        CampaignDailyStats.objects.bulk_create(daily_stats.values(), batch_size=1000)
+
+        self.stdout.write(f"Rebuilt {len(daily_stats)} daily stats rows")
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("advertisers", "0010_campaign_campaign_active_dates_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CampaignDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("date", models.IntegerField(verbose_name="День")),
+                (
+                    "impressions",
+                    models.IntegerField(default=0, verbose_name="Количество показов"),
+                ),
+                (
+                    "clicks",
+                    models.IntegerField(default=0, verbose_name="Количество кликов"),
+                ),
+                (
+                    "spent_impressions",
+                    models.IntegerField(default=0, verbose_name="Потрачено на показы"),
+                ),
+                (
+                    "spent_clicks",
+                    models.IntegerField(default=0, verbose_name="Потрачено на клики"),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="advertisers.campaign",
+                        verbose_name="Реклама",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "date"), name="unique_campaign_daily_stats"
+                    )
+                ],
+            },
+        ),
+    ]
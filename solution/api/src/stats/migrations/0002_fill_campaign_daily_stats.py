@@ -0,0 +1,37 @@
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def fill_campaign_daily_stats(apps, schema_editor):
+    CampaignDailyStats = apps.get_model("stats", "CampaignDailyStats")
+    daily_stats = {}
+    for model_name, count_field, spent_field in [
+        ("AdImpression", "impressions", "spent_impressions"),
+        ("AdClick", "clicks", "spent_clicks"),
+    ]:
+        model = apps.get_model("clients", model_name)
+        totals = model.objects.values("campaign", "created_at").annotate(
+            count=Count("id"), spent=Sum("cost")
+        )
+        for total in totals:
+            key = (total["campaign"], total["created_at"])
+            if key not in daily_stats:
+                daily_stats[key] = CampaignDailyStats(
+                    campaign_id=total["campaign"], date=total["created_at"]
+                )
+            setattr(daily_stats[key], count_field, total["count"])
+            setattr(daily_stats[key], spent_field, total["spent"])
+
+    CampaignDailyStats.objects.bulk_create(daily_stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clients", "0009_event_indexes_and_unique_constraints"),
+        ("stats", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_campaign_daily_stats, migrations.RunPython.noop),
+    ]
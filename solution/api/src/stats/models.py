@@ -0,0 +1,51 @@
+from django.db import models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from advertisers.models import Campaign
+from core.models import UUIDModel
+
+
+class CampaignDailyStats(UUIDModel):
+    campaign = models.ForeignKey(
+        Campaign,
+        related_name="daily_stats",
+        on_delete=models.CASCADE,
+        verbose_name="Реклама",
+        db_index=False,
+    )
+    date = models.IntegerField("День")
+    impressions = models.IntegerField("Количество показов", default=0)
+    clicks = models.IntegerField("Количество кликов", default=0)
+    spent_impressions = models.IntegerField("Потрачено на показы", default=0)
+    spent_clicks = models.IntegerField("Потрачено на клики", default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "date"], name="unique_campaign_daily_stats"
+            )
+        ]
+
+    @classmethod
+    def add_events(cls, events, inserted_events, count_field, spent_field):
+        keys = {(event.campaign_id, event.created_at) for event in events}
+        cls.objects.bulk_create(
+            [cls(campaign_id=campaign_id, date=date) for campaign_id, date in keys],
+            ignore_conflicts=True,
+        )
+
+        daily_events = inserted_events.filter(
+            campaign=OuterRef("campaign"), created_at=OuterRef("date")
+        )
+        cls.objects.filter(
+            campaign_id__in={campaign_id for campaign_id, _ in keys},
+            date__in={date for _, date in keys},
+        ).update(
+            **{
+                count_field: F(count_field)
+                + Coalesce(Subquery(daily_events.values("count")), 0),
+                spent_field: F(spent_field)
+                + Coalesce(Subquery(daily_events.values("spent")), 0),
+            }
+        )
@@ -0,0 +1,147 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from advertisers.models import Advertiser, Campaign
+from clients.models import Client, AdClick, AdImpression
+from stats.models import CampaignDailyStats
+
+
+class StatsTestCase(APITestCase):
+    def setUp(self):
+        self.advertiser = Advertiser.objects.create(name="Test Advertiser")
+        self.campaigns = [self.create_campaign() for _ in range(2)]
+        self.clients = [
+            Client.objects.create(
+                login=f"user_{i}", age=20, location="A", gender="MALE"
+            )
+            for i in range(3)
+        ]
+
+        for client in self.clients:
+            AdImpression.objects.create(
+                campaign=self.campaigns[0], client=client, cost=2, created_at=1
+            )
+        AdImpression.objects.create(
+            campaign=self.campaigns[1], client=self.clients[0], cost=3, created_at=2
+        )
+        AdClick.objects.create(
+            campaign=self.campaigns[0], client=self.clients[0], cost=5, created_at=1
+        )
+        AdClick.objects.create(
+            campaign=self.campaigns[0], client=self.clients[1], cost=7, created_at=3
+        )
+        call_command("rebuild_campaign_stats", stdout=StringIO())
+
+    def create_campaign(self):
+        return Campaign.objects.create(
+            advertiser=self.advertiser,
+            impressions_limit=100,
+            clicks_limit=100,
+            cost_per_impression=1,
+            cost_per_click=1,
+            ad_title="title",
+            ad_text="text",
+            start_date=0,
+            end_date=10,
+        )
+
+    def test_campaign_stats(self):
+        response = self.client.get(f"/stats/campaigns/{self.campaigns[0].id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {
+                "spent_impressions": 6,
+                "spent_clicks": 12,
+                "spent_total": 18,
+                "impressions_count": 3,
+                "clicks_count": 2,
+                "conversion": 2 / 3 * 100,
+            },
+        )
+
+    def test_empty_campaign_stats(self):
+        campaign = self.create_campaign()
+        response = self.client.get(f"/stats/campaigns/{campaign.id}")
+        self.assertEqual(response.data["spent_total"], 0)
+        self.assertEqual(response.data["conversion"], 0)
+
+    def test_advertiser_stats(self):
+        response = self.client.get(f"/stats/advertisers/{self.advertiser.id}/campaigns")
+        self.assertEqual(response.data["spent_total"], 21)
+        self.assertEqual(response.data["impressions_count"], 4)
+        self.assertEqual(response.data["clicks_count"], 2)
+        self.assertEqual(response.data["conversion"], 50)
+
+    def test_campaign_daily_stats(self):
+        response = self.client.get(f"/stats/campaigns/{self.campaigns[0].id}/daily")
+        self.assertEqual(
+            [
+                (day["date"], day["impressions_count"], day["spent_total"])
+                for day in response.data
+            ],
+            [(1, 3, 11), (3, 0, 7)],
+        )
+
+    def test_advertiser_daily_stats(self):
+        response = self.client.get(f"/stats/advertisers/{self.advertiser.id}/daily")
+        self.assertEqual(
+            [(day["date"], day["spent_total"]) for day in response.data],
+            [(1, 11), (2, 3), (3, 7)],
+        )
+
+    def test_not_found(self):
+        response = self.client.get(
+            "/stats/advertisers/00000000-0000-0000-0000-000000000000/campaigns"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_queries_do_not_grow_with_campaigns(self):
+        url = f"/stats/advertisers/{self.advertiser.id}/campaigns"
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+        for _ in range(5):
+            AdImpression.record(self.create_campaign(), self.clients[0])
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def get_daily_stats(self, campaign):
+        return list(
+            CampaignDailyStats.objects.filter(campaign=campaign)
+            .order_by("date")
+            .values_list(
+                "date", "impressions", "clicks", "spent_impressions", "spent_clicks"
+            )
+        )
+
+    def test_record_updates_daily_stats(self):
+        campaign = self.create_campaign()
+        AdImpression.record(campaign, self.clients[0])
+        AdImpression.record(campaign, self.clients[0])
+        AdImpression.record_many(
+            [
+                AdImpression(campaign=campaign, client=client, cost=1)
+                for client in self.clients
+            ]
+        )
+        AdClick.record(campaign, self.clients[0])
+        AdClick.record(campaign, self.clients[0])
+
+        self.assertEqual(self.get_daily_stats(campaign), [(0, 3, 1, 3, 1)])
+
+        response = self.client.get(f"/stats/campaigns/{campaign.id}")
+        self.assertEqual(response.data["impressions_count"], 3)
+        self.assertEqual(response.data["clicks_count"], 1)
+
+    def test_rebuild_matches_incremental_stats(self):
+        campaign = self.create_campaign()
+        for client in self.clients:
+            AdImpression.record(campaign, client)
+        AdClick.record(campaign, self.clients[1])
+        incremental_stats = self.get_daily_stats(campaign)
+
+        call_command("rebuild_campaign_stats", stdout=StringIO())
+        self.assertEqual(self.get_daily_stats(campaign), incremental_stats)